@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
 import asyncio
+import base64
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -8,6 +11,7 @@ import subprocess
 import sys
 import tempfile
 import threading
+import time
 import uuid
 from datetime import datetime, timedelta
 from enum import Enum
@@ -18,11 +22,33 @@ import numpy as np
 from pandas.core.frame import DataFrame
 import yaml
 from pydantic import BaseModel, Field, validator
-import requests
+import httpx
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 import threading
 
+# orjson is an optional, much faster JSON decoder; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional Polars fast path for the group/aggregate tools, enabled with SAGE_USE_POLARS=1
+try:
+    import polars as pl
+    _POLARS_AVAILABLE = True
+except ImportError:
+    _POLARS_AVAILABLE = False
+_USE_POLARS = _POLARS_AVAILABLE and os.getenv("SAGE_USE_POLARS", "").lower() in ("1", "true", "yes")
+
+# HTTP/2 needs the optional h2 package; without it the shared client speaks HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 
 # Import everything from the sage_mcp_server package
 from sage_mcp_server import (
@@ -30,9 +56,9 @@ from sage_mcp_server import (
     SageConfig, TimeRange, NodeID, DataType, SelectorRequirements,
     PluginArguments, PluginSpec, SageJob, CameraSageJob,
     # Utils
-    safe_timestamp_format, parse_time_range,
+    safe_timestamp_format, parse_time_range, TTLCache,
     # Services
-    SageDataService, SageJobService, SAGEDocsHelper,
+    SageDataService, SageJobService, get_docs_helper,
     # Plugin system
     plugin_registry, plugin_query_service, PluginTemplate,
     PluginRequirements, PluginGenerator,
@@ -46,6 +72,178 @@ SAGE_API_BASE = "https://auth.sagecontinuum.org/api/v-beta"
 SAGE_MANIFESTS_URL = "https://auth.sagecontinuum.org/manifests/"
 SAGE_SENSORS_URL = "https://auth.sagecontinuum.org/sensors/"
 
+# Shared HTTP client for Sage API calls so TCP/TLS connections are reused across tool calls;
+# with HTTP/2, concurrent tool calls are multiplexed over a single connection
+_SAGE_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+_SAGE_SESSION = httpx.Client(
+    timeout=_SAGE_TIMEOUT,
+    # Sage endpoints redirect (e.g. trailing-slash normalization); follow them like requests did
+    follow_redirects=True,
+    # An explicit transport carries the pool limits and retries connection failures
+    transport=httpx.HTTPTransport(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=8),
+        retries=3,
+    ),
+    headers={"Accept": "application/json", "User-Agent": "sage-mcp/1.0"},
+)
+
+# Transient gateway errors from the Sage API are retried with exponential backoff
+_SAGE_RETRY_STATUSES = frozenset({502, 503, 504})
+_SAGE_STATUS_RETRIES = 3
+_SAGE_RETRY_BACKOFF = 0.2  # seconds, doubled on each retry
+
+# Shared async client for the image proxy, so connections to Sage storage stay open between requests
+_PROXY_CLIENT = httpx.AsyncClient(
+    http2=_HTTP2_AVAILABLE,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+    timeout=httpx.Timeout(30.0, connect=5.0),
+)
+# Proxied image bodies keyed by (url, credential hash), matching the max-age the proxy advertises.
+# Bodies are held to a 128 MiB total, evicting least recently used images; images over 8 MiB are
+# streamed through without being kept
+_PROXY_CACHE_BUDGET_BYTES = 128 * 1024 * 1024
+_PROXY_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_PROXY_IMAGE_CACHE = TTLCache(
+    maxsize=256, ttl=3600,
+    maxweight=_PROXY_CACHE_BUDGET_BYTES, weigh=lambda entry: len(entry[0]),
+)
+# Upstream objects announced as larger than this are refused rather than proxied
+_PROXY_MAX_BYTES = 25 * 1024 * 1024
+# Upstream image fetches in progress, so concurrent requests for one image wait for it to be cached
+_PROXY_INFLIGHT: Dict[Tuple[str, bytes], asyncio.Event] = {}
+_PROXY_INFLIGHT_WAIT = 30.0  # seconds a waiting request gives the first one before fetching itself
+# Send a second, hedged upstream request when the first has not answered within this many
+# milliseconds; 0 (the default) disables hedging
+_PROXY_HEDGE_DELAY = float(os.getenv("SAGE_PROXY_HEDGE_MS", "0")) / 1000
+
+
+# Image types inferred from the URL when Sage storage reports a generic content type
+_IMAGE_EXT_RE = re.compile(r"\.(jpe?g|png|gif|webp)(?:$|\?)", re.IGNORECASE)
+_IMAGE_EXT_MIME = {"jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png", "gif": "image/gif", "webp": "image/webp"}
+
+
+def _basic_auth_header(credentials: str) -> str:
+    """Basic Authorization header value for a 'username:password' string.
+
+    Deliberately uncached: client-supplied credentials must not outlive the request.
+    """
+    return f"Basic {base64.b64encode(credentials.encode()).decode()}"
+
+
+# Sage credentials from the environment are fixed for the process, so their header is built once
+_ENV_BASIC_AUTH = (
+    _basic_auth_header(f"{os.getenv('SAGE_USER')}:{os.getenv('SAGE_PASS')}")
+    if os.getenv("SAGE_USER") and os.getenv("SAGE_PASS") else None
+)
+
+
+async def _send_proxy_request(url: str, headers: Dict[str, str]) -> "httpx.Response":
+    """Send the streamed upstream image request, hedged with a second one if the first is slow.
+
+    Whichever request gets a response first wins; the other is cancelled, or closed if it also
+    completed. An exception is only raised once neither request can succeed.
+    """
+    def send():
+        return _PROXY_CLIENT.send(_PROXY_CLIENT.build_request("GET", url, headers=headers), stream=True)
+
+    if _PROXY_HEDGE_DELAY <= 0:
+        return await send()
+
+    winner, error = None, None
+    pending = {asyncio.ensure_future(send())}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=_PROXY_HEDGE_DELAY)
+        if not done:
+            logger.debug(f"Hedging slow image request: {url}")
+            pending.add(asyncio.ensure_future(send()))
+        while True:
+            for task in done:
+                if task.exception() is not None:
+                    error = task.exception()
+                elif winner is None:
+                    winner = task.result()
+                else:
+                    await task.result().aclose()
+            if winner is not None or not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
+    if winner is None:
+        raise error
+    return winner
+
+
+def _cached_image_response(cache_key: Tuple[str, bytes]) -> Optional["Response"]:
+    """Build a proxy response from the image cache, or return None on a miss"""
+    cached = _PROXY_IMAGE_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    body, content_type = cached
+    return Response(
+        content=body,
+        media_type=content_type,
+        headers={
+            "Cache-Control": "public, max-age=3600",
+            "X-Sage-Proxy": "hit"
+        }
+    )
+
+# Manifests and sensor listings change on the order of hours, so parsed responses are reused for a few minutes
+_SAGE_API_CACHE = TTLCache(maxsize=512, ttl=300)
+# (etag, last_modified, data) kept past the TTL, so expired entries are revalidated with a conditional GET
+_SAGE_API_VALIDATORS = TTLCache(maxsize=512, ttl=24 * 3600)
+
+
+def _get_sage_json(url: str) -> Tuple[int, Any]:
+    """Fetch and parse JSON from the Sage API, serving repeated calls from the TTL cache.
+
+    Once an entry expires it is revalidated with If-None-Match/If-Modified-Since, and a
+    304 reply reuses the previously parsed body. Returns (status_code, data); data is None
+    unless the status code is 200.
+    """
+    cached = _SAGE_API_CACHE.get(url)
+    if cached is not None:
+        return 200, cached
+
+    headers = {}
+    stale = _SAGE_API_VALIDATORS.get(url)
+    if stale is not None:
+        etag, last_modified, _ = stale
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    for attempt in range(_SAGE_STATUS_RETRIES + 1):
+        response = _SAGE_SESSION.get(url, headers=headers)
+        if response.status_code not in _SAGE_RETRY_STATUSES or attempt == _SAGE_STATUS_RETRIES:
+            break
+        logger.warning("Sage API returned %d for %s, retrying", response.status_code, url)
+        time.sleep(_SAGE_RETRY_BACKOFF * 2 ** attempt)
+    if response.status_code == 304 and stale is not None:
+        data = stale[2]
+    elif response.status_code != 200:
+        return response.status_code, None
+    else:
+        data = _json_loads(response.content)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            _SAGE_API_VALIDATORS.set(url, (etag, last_modified, data))
+    _SAGE_API_CACHE.set(url, data)
+    return 200, data
+
+# Splits comma-separated tool arguments and strips surrounding whitespace in one pass
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# Cleans markdown sensor descriptions in a single pass instead of chained str.replace calls
+_DESC_RE = re.compile(r'# |\r\n\r\n|\r\n')
+_DESC_REPLACEMENTS = {'# ': '', '\r\n\r\n': '\n', '\r\n': ' '}
+
 # Configure logging
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(level=getattr(logging, log_level, logging.INFO))
@@ -58,9 +256,9 @@ try:
     from fastmcp import FastMCP, Context
     from fastmcp.server.middleware import Middleware, MiddlewareContext
     from fastapi import HTTPException
-    from starlette.responses import Response
+    from starlette.background import BackgroundTask
+    from starlette.responses import Response, StreamingResponse
     from starlette.requests import Request
-    import httpx
     import sage_data_client
 except ImportError as e:
     logger.error(f"Import error: {e}")
@@ -278,6 +476,7 @@ def get_node_all_data(node_id: str, time_range: str = "-5m", max_records: int =
         
         if df.empty:
             return f"No data found for node {node_str} in the last {validated_time}"
+        _categorize(df)
         
         # Track original size
         original_size = len(df)
@@ -285,61 +484,70 @@ def get_node_all_data(node_id: str, time_range: str = "-5m", max_records: int =
         # Limit records for processing to prevent timeouts
         if len(df) > max_records:
             logger.warning(f"Dataset has {len(df)} records, limiting to {max_records} most recent for processing")
-            df = df.sort_values('timestamp', ascending=False).head(max_records)
+            df = df.nlargest(max_records, 'timestamp')
         
         # Get time range
         time_start = safe_timestamp_format(df.timestamp.min())
         time_end = safe_timestamp_format(df.timestamp.max())
         
-        result = f"All sensor data for node {node_str} ({validated_time}):\n"
-        result += f"Total measurements available: {original_size:,}\n"
+        parts = [f"All sensor data for node {node_str} ({validated_time}):\n"]
+        parts.append(f"Total measurements available: {original_size:,}\n")
         if original_size > max_records:
-            result += f"Showing summary of {max_records:,} most recent (use max_records parameter to adjust)\n"
-        result += f"Time range: {time_start} to {time_end}\n\n"
+            parts.append(f"Showing summary of {max_records:,} most recent (use max_records parameter to adjust)\n")
+        parts.append(f"Time range: {time_start} to {time_end}\n\n")
         
         # Optimize grouping - use observed=True to avoid processing empty categories
         # Only process numeric columns for stats
-        numeric_df = df[df['value'].apply(lambda x: isinstance(x, (int, float, np.number)))]
+        is_numeric = df['value'].map(lambda x: isinstance(x, (int, float, np.number))).astype(bool)
+        numeric_df = df[is_numeric]
         
         if not numeric_df.empty:
-            summary = numeric_df.groupby(["name", "meta.sensor"], observed=True).agg({
-                "value": ["count", "min", "max", "mean"]
-            }).round(2)
+            summary = (
+                _value_stats(numeric_df, ["name", "meta.sensor"])
+                .reset_index()
+            )
             
             # Limit output to prevent huge responses
             max_measurement_types = 50
-            measurement_count = 0
             
             # Add summary by measurement type
-            for (name, sensor), group in summary.iterrows():
-                measurement_count += 1
+            for measurement_count, (name, sensor, count, vmin, vmax, vmean) in enumerate(
+                summary.itertuples(index=False, name=None), start=1
+            ):
                 if measurement_count > max_measurement_types:
                     remaining = len(summary) - max_measurement_types
-                    result += f"\n... and {remaining} more measurement types (increase max_records to see more)\n"
+                    parts.append(f"\n... and {remaining} more measurement types (increase max_records to see more)\n")
                     break
                     
-                result += f"{name} ({sensor}):\n"
-                result += f"  Count: {int(group[('value', 'count')]):,}\n"
-                result += f"  Range: {group[('value', 'min')]} to {group[('value', 'max')]}\n"
-                result += f"  Average: {group[('value', 'mean')]}\n\n"
+                parts.append(f"{name} ({sensor}):\n")
+                parts.append(f"  Count: {int(count):,}\n")
+                parts.append(f"  Range: {vmin:.2f} to {vmax:.2f}\n")
+                parts.append(f"  Average: {vmean:.2f}\n\n")
         
         # Handle non-numeric data types
-        non_numeric_df = df[~df['value'].apply(lambda x: isinstance(x, (int, float, np.number)))]
+        non_numeric_df = df[~is_numeric]
         if not non_numeric_df.empty:
             non_numeric_types = non_numeric_df.groupby(["name", "meta.sensor"], observed=True).size()
-            result += "\nNon-numeric measurements:\n"
+            parts.append("\nNon-numeric measurements:\n")
             for (name, sensor), count in non_numeric_types.head(20).items():
-                result += f"{name} ({sensor}): {count:,} records\n"
+                parts.append(f"{name} ({sensor}): {count:,} records\n")
             if len(non_numeric_types) > 20:
-                result += f"... and {len(non_numeric_types) - 20} more types\n"
+                parts.append(f"... and {len(non_numeric_types) - 20} more types\n")
         
-        result += f"\nTip: Use search_measurements() or query_job_data() for specific measurement types\n"
+        parts.append(f"\nTip: Use search_measurements() or query_job_data() for specific measurement types\n")
         
-        return result
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error getting all data for node {node_id}: {e}", exc_info=True)
         return f"Error getting all data for node {node_id}: {str(e)}"
 
+# Measurement names reported by get_node_iio_data, in display order
+_IIO_MEASUREMENTS = DataType.iio_types() + [DataType.TEMPERATURE.value,
+                                            DataType.HUMIDITY.value,
+                                            DataType.PRESSURE.value]
+_IIO_MEASUREMENTS_SET = frozenset(_IIO_MEASUREMENTS)
+
+
 @mcp.tool()
 def get_node_iio_data(node_id: str, time_range: str = "-30m") -> str:
     """Get IIO (Industrial I/O) sensor data for a specific node"""
@@ -361,32 +569,31 @@ def get_node_iio_data(node_id: str, time_range: str = "-30m") -> str:
         if df.empty:
             return f"No IIO data found for node {validated_node} in the last {validated_time}"
 
-        # Process IIO measurements
-        iio_measurements = DataType.iio_types() + [DataType.TEMPERATURE.value,
-                                                 DataType.HUMIDITY.value,
-                                                 DataType.PRESSURE.value]
+        parts = [f"IIO sensor data for node {validated_node} ({validated_time}):\n"]
+        parts.append(f"Total IIO measurements: {len(df)}\n\n")
 
-        result = f"IIO sensor data for node {validated_node} ({validated_time}):\n"
-        result += f"Total IIO measurements: {len(df)}\n\n"
+        # Aggregate every known measurement type per sensor in one groupby
+        is_known = df['name'].isin(_IIO_MEASUREMENTS_SET)
+        stats = df[is_known].groupby(['name', 'meta.sensor'], observed=True).value.agg(['count', 'min', 'max', 'mean'])
+        sensor_lines: Dict[str, List[str]] = {}
+        for (name, sensor), count, vmin, vmax, vmean in stats.itertuples(name=None):
+            sensor_lines.setdefault(name, []).append(
+                f"  {sensor}: {count} readings, range: {vmin:.2f}-{vmax:.2f}, avg: {vmean:.2f}\n"
+            )
 
         # Process each measurement type
-        for measurement in iio_measurements:
-            measurement_df = df[df['name'] == measurement]
-            if not measurement_df.empty:
-                stats = measurement_df.groupby('meta.sensor').value.agg(['count', 'min', 'max', 'mean'])
-                result += f"{measurement}:\n"
-                for sensor, sensor_stats in stats.iterrows():
-                    result += f"  {sensor}: {sensor_stats['count']} readings, "
-                    result += f"range: {sensor_stats['min']:.2f}-{sensor_stats['max']:.2f}, "
-                    result += f"avg: {sensor_stats['mean']:.2f}\n"
-                result += "\n"
+        for measurement in _IIO_MEASUREMENTS:
+            if measurement in sensor_lines:
+                parts.append(f"{measurement}:\n")
+                parts.extend(sensor_lines[measurement])
+                parts.append("\n")
 
         # Show any other IIO measurements found
-        other_measurements = df[~df['name'].isin(iio_measurements)]['name'].unique()
+        other_measurements = df.loc[~is_known, 'name'].unique()
         if len(other_measurements) > 0:
-            result += f"Other IIO measurements found: {', '.join(other_measurements)}\n"
+            parts.append(f"Other IIO measurements found: {', '.join(other_measurements)}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error getting IIO data for node {node_id}: {str(e)}"
@@ -406,25 +613,22 @@ def get_environmental_summary(node_id: str = "", time_range: str = "-1h") -> str
         if df.empty:
             node_text = f"node {validated_node}" if validated_node else "any nodes"
             return f"No environmental data found for {node_text} in the last {validated_time}"
+        _categorize(df)
 
-        result = f"Environmental data summary ({validated_node or 'all nodes'}, {validated_time}):\n\n"
+        parts = [f"Environmental data summary ({validated_node or 'all nodes'}, {validated_time}):\n\n"]
 
         # Group by node, measurement type, and sensor
-        grouped = df.groupby(["meta.vsn", "name", "meta.sensor"]).value.agg([
-            "count", "min", "max", "mean"
-        ]).round(2)
+        grouped = _value_stats(df, ["meta.vsn", "name", "meta.sensor"])
 
         current_node = None
-        for (vsn, name, sensor), stats in grouped.iterrows():
+        for (vsn, name, sensor), count, vmin, vmax, vmean in grouped.itertuples(name=None):
             if current_node != vsn:
                 current_node = vsn
-                result += f"\nNode {vsn}:\n"
+                parts.append(f"\nNode {vsn}:\n")
 
-            result += f"  {name} ({sensor}): "
-            result += f"{stats['count']} readings, "
-            result += f"{stats['min']}-{stats['max']} (avg: {stats['mean']})\n"
+            parts.append(f"  {name} ({sensor}): {int(count)} readings, {vmin:.2f}-{vmax:.2f} (avg: {vmean:.2f})\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Error getting environmental summary: {str(e)}"
@@ -433,27 +637,26 @@ def get_environmental_summary(node_id: str = "", time_range: str = "-1h") -> str
 def list_available_nodes(time_range: str = "-1h") -> str:
     """List all available sensor nodes and their last activity"""
     try:
-        # Initialize data service
-        data_service = SageDataService()
-
         # Query environmental data
         df = data_service.query_environmental_data(time_range=time_range)
         if df.empty:
             return "No active nodes found in the specified time range."
+        _categorize(df)
 
         # Get unique nodes and their latest data
         nodes = df['meta.vsn'].unique().tolist()
-        result = []
 
         deployed_nodes = []
         development_nodes = []
         other_nodes = []
         production_nodes = []
 
+        # Latest row per node from a single stable sort instead of a mask + sort per node
+        latest = df.sort_values('timestamp', kind='mergesort').groupby('meta.vsn', sort=False, observed=True).tail(1)
+        phases = dict(zip(latest['meta.vsn'], latest['meta.phase'])) if 'meta.phase' in latest.columns else {}
+
         for node in nodes:
-            node_df = df[df['meta.vsn'] == node]
-            latest = node_df.sort_values('timestamp').iloc[-1]
-            phase = latest.get('meta.phase', 'Unknown')
+            phase = phases.get(node, 'Unknown')
 
             # Format node info
             node_info = f"- {node}"
@@ -464,36 +667,147 @@ def list_available_nodes(time_range: str = "-1h") -> str:
             else:
                 other_nodes.append(node_info)
 
-        result = f"Available Sage Nodes ({len(nodes)} total):\n\n"
+        parts = [f"Available Sage Nodes ({len(nodes)} total):\n\n"]
 
         if deployed_nodes:
-            result += f"Deployed Nodes ({len(deployed_nodes)}):\n"
-            result += "\n".join(deployed_nodes)
-            result += "\n"
+            parts.append(f"Deployed Nodes ({len(deployed_nodes)}):\n")
+            parts.append("\n".join(deployed_nodes))
+            parts.append("\n")
 
         if development_nodes:
-            result += f"Development Nodes ({len(development_nodes)}):\n"
-            result += "\n".join(development_nodes)
-            result += "\n"
+            parts.append(f"Development Nodes ({len(development_nodes)}):\n")
+            parts.append("\n".join(development_nodes))
+            parts.append("\n")
 
         if production_nodes:
-            result += f"Production Nodes ({len(production_nodes)}):\n"
-            result += "\n".join(production_nodes)
-            result += "\n"
+            parts.append(f"Production Nodes ({len(production_nodes)}):\n")
+            parts.append("\n".join(production_nodes))
+            parts.append("\n")
 
         if other_nodes:
-            result += f"Other Nodes ({len(other_nodes)}):\n"
-            result += "\n".join(other_nodes)
+            parts.append(f"Other Nodes ({len(other_nodes)}):\n")
+            parts.append("\n".join(other_nodes))
 
-        result += "\nTip: For detailed node information, use get_node_info(node_id)"
-        result += "\nTip: For recent sensor activity, use get_environmental_summary()"
+        parts.append("\nTip: For detailed node information, use get_node_info(node_id)")
+        parts.append("\nTip: For recent sensor activity, use get_environmental_summary()")
 
-        return result.strip()
+        return "".join(parts).strip()
 
     except Exception as e:
         logger.error(f"Error listing nodes: {e}")
         return f"Error listing nodes: {str(e)}"
 
+@functools.lru_cache(maxsize=256)
+def _normalize_plugin_pattern(pattern: str) -> str:
+    """Wrap a measurement pattern (or each '|' alternative) in '.*' wildcards for substring matching"""
+    if '|' in pattern:
+        # For OR conditions, ensure each part has proper wildcards
+        return '|'.join(_normalize_plugin_pattern(part.strip()) for part in pattern.split('|'))
+    if not pattern.startswith('.*'):
+        pattern = f".*{pattern}"
+    if not pattern.endswith('.*'):
+        pattern = f"{pattern}.*"
+    return pattern
+
+
+# Repeated string columns that the tools group and filter on
+_CATEGORY_COLUMNS = ("meta.vsn", "meta.sensor", "name", "plugin", "meta.phase")
+
+
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the repeated string columns of a query result to category dtype, in place"""
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _keep_columns(df: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """Drop every column of a query result that a tool does not read"""
+    return df.drop(columns=[c for c in df.columns if c not in columns])
+
+
+def _value_stats(df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """Per-group count/min/max/mean of the value column, indexed and sorted by keys"""
+    if _USE_POLARS:
+        values = df['value']
+        if values.dtype == object:
+            values = pd.to_numeric(values)
+        # Match pandas: NaN values are skipped rather than counted, and rows with a missing key
+        # are left out of the groups; keys are compared as strings so both sort the same way
+        value = pl.col("value").cast(pl.Float64).fill_nan(None)
+        frame = pl.from_pandas(df[keys].assign(value=values))
+        return (
+            frame
+            .with_columns(pl.col(keys).cast(pl.String))
+            .drop_nulls(keys)
+            .group_by(keys)
+            .agg(value.count().cast(pl.Int64).alias("count"), value.min().alias("min"),
+                 value.max().alias("max"), value.mean().alias("mean"))
+            .sort(keys)
+            .to_pandas()
+            .set_index(keys)
+        )
+    return df.groupby(keys, observed=True)['value'].agg(['count', 'min', 'max', 'mean'])
+
+
+def _recent_samples(frame: pd.DataFrame, n: int = 3, columns: Tuple[str, ...] = ('meta.vsn', 'name', 'value')):
+    """Yield (timestamp, *columns) for the n most recent rows, using 'N/A' for missing columns"""
+    recent = frame.nlargest(n, 'timestamp')
+    missing = ['N/A'] * len(recent)
+    columns = [recent[col] if col in recent.columns else missing for col in columns]
+    return zip(recent['timestamp'], *columns)
+
+
+def _sorted_unique(series: pd.Series) -> List[Any]:
+    """Sorted distinct values of a column, working on category codes when the column is categorical"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = np.unique(series.cat.codes.to_numpy())
+        categories = series.cat.categories
+        values = categories.take(codes[codes >= 0])
+        # Categories inferred by astype('category') are already sorted, so code order is value order
+        return (values if categories.is_monotonic_increasing else values.sort_values()).tolist()
+    return sorted(series.unique())
+
+
+# The only columns the job, cloud and image summaries read
+_SUMMARY_COLUMNS = ['timestamp', 'meta.vsn', 'plugin', 'name', 'value']
+
+
+def _distinct_by_plugin(df: pd.DataFrame, column: str) -> Dict[Any, List[Any]]:
+    """Sorted distinct values of column for each plugin, from one drop_duplicates over the pairs"""
+    pairs = df[['plugin', column]].drop_duplicates().dropna().sort_values(column, kind='stable')
+    by_plugin: Dict[Any, List[Any]] = {}
+    for plugin, value in zip(pairs['plugin'], pairs[column]):
+        by_plugin.setdefault(plugin, []).append(value)
+    return by_plugin
+
+
+def _plugin_summaries(df: pd.DataFrame, n: int = 3):
+    """Yield (plugin, records, nodes, measurements, recent) per plugin in sorted order.
+
+    nodes and measurements are sorted distinct values and recent holds the plugin's n most
+    recent rows, all computed from whole-frame passes rather than a mask per plugin.
+    """
+    records = df.groupby('plugin', sort=True, observed=True).size()
+    nodes = _distinct_by_plugin(df, 'meta.vsn')
+    measurements = _distinct_by_plugin(df, 'name')
+    # Select each plugin's newest rows with a per-group partial selection rather than sorting everything
+    recent_index = df.groupby('plugin', sort=False, observed=True)['timestamp'].nlargest(n).index.get_level_values(-1)
+    recent_by_plugin = dict(tuple(df.loc[recent_index].groupby('plugin', sort=False, observed=True)))
+    for plugin, count in records.items():
+        yield plugin, count, nodes.get(plugin, []), measurements.get(plugin, []), recent_by_plugin[plugin]
+
+
+def _format_sample_value(value: Any) -> str:
+    """Render the ' | Value: ...' suffix of a sample line, or nothing when the value is missing"""
+    if isinstance(value, (int, float)):
+        return f" | Value: {value:.2f}"
+    if value != 'N/A':
+        return f" | Value: {value}"
+    return ""
+
+
 @mcp.tool()
 def search_measurements(
     measurement_pattern: str,
@@ -510,27 +824,7 @@ def search_measurements(
         # Build filter parameters with better pattern matching
         filter_params: Dict[str, Any] = {}
 
-        # Handle different pattern types
-        if '|' in measurement_pattern:
-            # For OR conditions, ensure each part has proper wildcards
-            patterns = []
-            for part in measurement_pattern.split('|'):
-                part = part.strip()
-                # Add wildcards if needed
-                if not part.startswith('.*'):
-                    part = f".*{part}"
-                if not part.endswith('.*'):
-                    part = f"{part}.*"
-                patterns.append(part)
-            filter_params["plugin"] = '|'.join(patterns)
-        else:
-            # Single pattern - ensure it has proper wildcards
-            pattern = measurement_pattern
-            if not pattern.startswith('.*'):
-                pattern = f".*{pattern}"
-            if not pattern.endswith('.*'):
-                pattern = f"{pattern}.*"
-            filter_params["plugin"] = pattern
+        filter_params["plugin"] = _normalize_plugin_pattern(measurement_pattern)
 
         # Add node filter if specified
         if validated_node:
@@ -552,70 +846,50 @@ def search_measurements(
         if df.empty:
             node_text = f" for node {validated_node}" if validated_node else ""
             return f"No measurements matching '{measurement_pattern}'{node_text} found in the last {validated_time}"
+        _categorize(df)
 
         # Show what was found
-        result = f"Found {len(df)} records matching '{measurement_pattern}':\n"
-        result += f"Time range: {validated_time}\n"
+        parts = [f"Found {len(df)} records matching '{measurement_pattern}':\n"]
+        parts.append(f"Time range: {validated_time}\n")
 
         # Group by plugin first
-        plugins = sorted(df['plugin'].unique()) if 'plugin' in df.columns else []
+        plugins = _sorted_unique(df['plugin']) if 'plugin' in df.columns else []
         if plugins:
-            result += f"\nPlugins found ({len(plugins)}):\n"
+            parts.append(f"\nPlugins found ({len(plugins)}):\n")
             for plugin in plugins:
                 plugin_df = df[df['plugin'] == plugin]
-                result += f"\n{plugin}:\n"
+                parts.append(f"\n{plugin}:\n")
 
                 # Get nodes for this plugin
-                nodes = sorted(plugin_df['meta.vsn'].unique())
-                result += f"- Nodes: {', '.join(nodes)}\n"
+                nodes = _sorted_unique(plugin_df['meta.vsn'])
+                parts.append(f"- Nodes: {', '.join(nodes)}\n")
 
                 # Get measurements for this plugin
-                measurements = sorted(plugin_df['name'].unique())
-                result += f"- Measurements: {', '.join(measurements)}\n"
+                measurements = _sorted_unique(plugin_df['name'])
+                parts.append(f"- Measurements: {', '.join(measurements)}\n")
 
                 # Show recent data samples
-                result += "- Recent data:\n"
-                recent = plugin_df.sort_values('timestamp', ascending=False).head(3)
-                for _, row in recent.iterrows():
-                    timestamp = safe_timestamp_format(row['timestamp'])
-                    node = row.get('meta.vsn', 'N/A')
-                    name = row.get('name', 'N/A')
-                    value = row.get('value', 'N/A')
-
-                    result += f"  {timestamp} | Node {node} | {name}"
-                    if isinstance(value, (int, float)):
-                        result += f" | Value: {value:.2f}"
-                    elif value != 'N/A':
-                        result += f" | Value: {value}"
-                    result += "\n"
+                parts.append("- Recent data:\n")
+                for ts, node, name, value in _recent_samples(plugin_df):
+                    parts.append(f"  {safe_timestamp_format(ts)} | Node {node} | {name}{_format_sample_value(value)}\n")
         else:
             # If no plugins found, group by measurement name
-            measurements = sorted(df['name'].unique())
-            result += f"\nMeasurements found ({len(measurements)}):\n"
+            measurements = _sorted_unique(df['name'])
+            parts.append(f"\nMeasurements found ({len(measurements)}):\n")
             for measurement in measurements:
                 measurement_df = df[df['name'] == measurement]
-                result += f"\n{measurement}:\n"
+                parts.append(f"\n{measurement}:\n")
 
                 # Get nodes for this measurement
-                nodes = sorted(measurement_df['meta.vsn'].unique())
-                result += f"- Nodes: {', '.join(nodes)}\n"
+                nodes = _sorted_unique(measurement_df['meta.vsn'])
+                parts.append(f"- Nodes: {', '.join(nodes)}\n")
 
                 # Show recent data samples
-                result += "- Recent data:\n"
-                recent = measurement_df.sort_values('timestamp', ascending=False).head(3)
-                for _, row in recent.iterrows():
-                    timestamp = safe_timestamp_format(row['timestamp'])
-                    node = row.get('meta.vsn', 'N/A')
-                    value = row.get('value', 'N/A')
-
-                    result += f"  {timestamp} | Node {node}"
-                    if isinstance(value, (int, float)):
-                        result += f" | Value: {value:.2f}"
-                    elif value != 'N/A':
-                        result += f" | Value: {value}"
-                    result += "\n"
+                parts.append("- Recent data:\n")
+                for ts, node, _, value in _recent_samples(measurement_df):
+                    parts.append(f"  {safe_timestamp_format(ts)} | Node {node}{_format_sample_value(value)}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error searching measurements: {e}")
@@ -714,46 +988,45 @@ def get_node_info(node_id: str) -> str:
         url = f"{SAGE_API_BASE}/nodes/{validated_node}/"
         logger.info(f"Fetching from {url}")
 
-        response = requests.get(url)
-        if response.status_code == 200:
-            node_info = response.json()
+        status_code, node_info = _get_sage_json(url)
+        if status_code == 200:
 
             # Format the response in a readable way
-            formatted_info = f"Node {validated_node} Information:\n"
-            formatted_info += f"- Name: {node_info.get('name', 'Unknown')}\n"
-            formatted_info += f"- Project: {node_info.get('project', 'Unknown')}\n"
-            formatted_info += f"- Type: {node_info.get('type', 'Unknown')}\n"
-            formatted_info += f"- Focus: {node_info.get('focus', 'Unknown')}\n"
-            formatted_info += f"- Phase: {node_info.get('phase', 'Unknown')}\n"
-            formatted_info += f"- Location: {node_info.get('location', 'Unknown')}\n"
-            formatted_info += f"- Address: {node_info.get('address', 'Unknown')}\n"
+            parts = [f"Node {validated_node} Information:\n"]
+            parts.append(f"- Name: {node_info.get('name', 'Unknown')}\n")
+            parts.append(f"- Project: {node_info.get('project', 'Unknown')}\n")
+            parts.append(f"- Type: {node_info.get('type', 'Unknown')}\n")
+            parts.append(f"- Focus: {node_info.get('focus', 'Unknown')}\n")
+            parts.append(f"- Phase: {node_info.get('phase', 'Unknown')}\n")
+            parts.append(f"- Location: {node_info.get('location', 'Unknown')}\n")
+            parts.append(f"- Address: {node_info.get('address', 'Unknown')}\n")
 
             if node_info.get('gps_lat') and node_info.get('gps_lon'):
-                formatted_info += f"- GPS: {node_info.get('gps_lat')}, {node_info.get('gps_lon')}\n"
+                parts.append(f"- GPS: {node_info.get('gps_lat')}, {node_info.get('gps_lon')}\n")
 
             # Sensors section
             sensors = node_info.get('sensors', [])
             if sensors:
-                formatted_info += f"\nSensors ({len(sensors)}):\n"
+                parts.append(f"\nSensors ({len(sensors)}):\n")
                 for sensor in sensors:
                     status = "Active" if sensor.get('is_active') else "Inactive"
-                    formatted_info += f"- {sensor.get('name', 'Unknown')}: {sensor.get('hw_model', 'Unknown')} ({sensor.get('manufacturer', 'Unknown')}) - {status}\n"
+                    parts.append(f"- {sensor.get('name', 'Unknown')}: {sensor.get('hw_model', 'Unknown')} ({sensor.get('manufacturer', 'Unknown')}) - {status}\n")
                     if sensor.get('capabilities'):
-                        formatted_info += f"  Capabilities: {', '.join(sensor.get('capabilities'))}\n"
+                        parts.append(f"  Capabilities: {', '.join(sensor.get('capabilities'))}\n")
 
             # Computes section
             computes = node_info.get('computes', [])
             if computes:
-                formatted_info += f"\nCompute Resources ({len(computes)}):\n"
+                parts.append(f"\nCompute Resources ({len(computes)}):\n")
                 for compute in computes:
                     status = "Active" if compute.get('is_active') else "Inactive"
-                    formatted_info += f"- {compute.get('name', 'Unknown')}: {compute.get('hw_model', 'Unknown')} ({compute.get('manufacturer', 'Unknown')}) - {status}\n"
+                    parts.append(f"- {compute.get('name', 'Unknown')}: {compute.get('hw_model', 'Unknown')} ({compute.get('manufacturer', 'Unknown')}) - {status}\n")
                     if compute.get('capabilities'):
-                        formatted_info += f"  Capabilities: {', '.join(compute.get('capabilities'))}\n"
+                        parts.append(f"  Capabilities: {', '.join(compute.get('capabilities'))}\n")
 
-            return formatted_info
+            return "".join(parts)
         else:
-            return f"Error: Could not retrieve node information. Status code: {response.status_code}"
+            return f"Error: Could not retrieve node information. Status code: {status_code}"
 
     except Exception as e:
         logger.error(f"Error in get_node_info: {e}")
@@ -765,48 +1038,64 @@ def list_all_nodes() -> str:
     try:
         logger.info(f"Fetching all nodes from {SAGE_MANIFESTS_URL}")
 
-        response = requests.get(SAGE_MANIFESTS_URL)
-        if response.status_code == 200:
-            nodes = response.json()
+        status_code, nodes = _get_sage_json(SAGE_MANIFESTS_URL)
+        if status_code == 200:
 
             # Format the response in a readable way
-            formatted_info = f"Available Sage Nodes ({len(nodes)}):\n"
+            parts = [f"Available Sage Nodes ({len(nodes)}):\n"]
 
             # Group nodes by phase
             deployed_nodes = []
             other_nodes = []
 
             for node in nodes:
-                node_info = f"- {node.get('vsn', 'Unknown')} ({node.get('name', 'Unknown')})"
+                label = f"- {node.get('vsn', 'Unknown')} ({node.get('name', 'Unknown')})"
+                phase = node.get('phase', 'Unknown phase')
 
-                if node.get('phase') == 'Deployed':
-                    if node.get('address'):
-                        node_info += f": {node.get('address')}"
-                    deployed_nodes.append(node_info)
+                if phase == 'Deployed':
+                    address = node.get('address')
+                    deployed_nodes.append(f"{label}: {address}" if address else label)
                 else:
-                    phase = node.get('phase', 'Unknown phase')
-                    node_info += f": {phase}"
-                    other_nodes.append(node_info)
+                    other_nodes.append(f"{label}: {phase}")
 
             if deployed_nodes:
-                formatted_info += "\n\nDeployed Nodes:\n"
-                formatted_info += "\n".join(deployed_nodes)
+                parts.append("\n\nDeployed Nodes:\n")
+                parts.append("\n".join(deployed_nodes))
 
             if other_nodes:
-                formatted_info += "\n\nOther Nodes:\n"
-                formatted_info += "\n".join(other_nodes)
+                parts.append("\n\nOther Nodes:\n")
+                parts.append("\n".join(other_nodes))
 
             # Add note about getting more details
-            formatted_info += "\n\nFor detailed information about a specific node, use get_node_info with the node ID."
+            parts.append("\n\nFor detailed information about a specific node, use get_node_info with the node ID.")
 
-            return formatted_info
+            return "".join(parts)
         else:
-            return f"Error: Could not retrieve node list. Status code: {response.status_code}"
+            return f"Error: Could not retrieve node list. Status code: {status_code}"
 
     except Exception as e:
         logger.error(f"Error in list_all_nodes: {e}")
         return f"Error listing all nodes: {str(e)}"
 
+# (sensor listing, [(sensor, searchable blob)]) for the most recently seen sensor listing
+_SENSOR_INDEX: Tuple[Any, List[Tuple[Dict[str, Any], str]]] = (None, [])
+
+
+def _sensor_index(all_sensors: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], str]]:
+    """Pair each sensor with its lowercased hardware, model and capabilities joined by a separator
+    that cannot occur in a query, rebuilt only when the sensor listing changes"""
+    global _SENSOR_INDEX
+    cached_sensors, index = _SENSOR_INDEX
+    if cached_sensors is not all_sensors:
+        index = [
+            (sensor, "\x01".join([sensor.get('hardware') or '', sensor.get('hw_model') or '',
+                                   *sensor.get('capabilities', [])]).lower())
+            for sensor in all_sensors
+        ]
+        _SENSOR_INDEX = (all_sensors, index)
+    return index
+
+
 @mcp.tool()
 def get_sensor_details(sensor_type: str) -> str:
     """Get detailed information about a specific type of sensor used in Sage nodes"""
@@ -817,52 +1106,96 @@ def get_sensor_details(sensor_type: str) -> str:
         logger.info(f"Getting sensor details for type: {sensor_type}")
         logger.info(f"Fetching from {SAGE_SENSORS_URL}")
 
-        response = requests.get(SAGE_SENSORS_URL)
-        if response.status_code == 200:
-            all_sensors = response.json()
+        status_code, all_sensors = _get_sage_json(SAGE_SENSORS_URL)
+        if status_code == 200:
 
             # Find matching sensors
-            matching_sensors = [s for s in all_sensors if
-                               sensor_type.lower() in s.get('hardware', '').lower() or
-                               sensor_type.lower() in s.get('hw_model', '').lower() or
-                               any(sensor_type.lower() in cap.lower() for cap in s.get('capabilities', []))]
+            query = sensor_type.lower()
+            matching_sensors = [sensor for sensor, blob in _sensor_index(all_sensors) if query in blob]
 
             if not matching_sensors:
                 return f"No sensors found matching '{sensor_type}'. Try a more general search term or check the spelling."
 
             # Format the response in a readable way
-            formatted_info = f"Sensor Information for '{sensor_type}' (Found {len(matching_sensors)} matches):\n"
+            parts = [f"Sensor Information for '{sensor_type}' (Found {len(matching_sensors)} matches):\n"]
 
             for i, sensor in enumerate(matching_sensors, 1):
-                formatted_info += f"\n--- Sensor {i}: {sensor.get('hw_model', 'Unknown')} ---\n"
-                formatted_info += f"- Hardware ID: {sensor.get('hardware', 'Unknown')}\n"
-                formatted_info += f"- Manufacturer: {sensor.get('manufacturer', 'Unknown')}\n"
+                parts.append(f"\n--- Sensor {i}: {sensor.get('hw_model', 'Unknown')} ---\n")
+                parts.append(f"- Hardware ID: {sensor.get('hardware', 'Unknown')}\n")
+                parts.append(f"- Manufacturer: {sensor.get('manufacturer', 'Unknown')}\n")
 
                 if sensor.get('capabilities'):
-                    formatted_info += f"- Capabilities: {', '.join(sensor.get('capabilities'))}\n"
+                    parts.append(f"- Capabilities: {', '.join(sensor.get('capabilities'))}\n")
 
                 if sensor.get('datasheet'):
-                    formatted_info += f"- Datasheet: {sensor.get('datasheet')}\n"
+                    parts.append(f"- Datasheet: {sensor.get('datasheet')}\n")
 
                 if sensor.get('vsns'):
-                    formatted_info += f"- Used in nodes: {', '.join(sensor.get('vsns'))}\n"
+                    parts.append(f"- Used in nodes: {', '.join(sensor.get('vsns'))}\n")
 
                 # Add description in a cleaner format
                 if sensor.get('description'):
-                    desc = sensor.get('description').replace('# ', '').replace('\r\n\r\n', '\n').replace('\r\n', ' ')
+                    desc = _DESC_RE.sub(lambda m: _DESC_REPLACEMENTS[m.group()], sensor.get('description'))
                     # Limit description length for readability
                     if len(desc) > 300:
                         desc = desc[:297] + "..."
-                    formatted_info += f"- Description: {desc}\n"
+                    parts.append(f"- Description: {desc}\n")
 
-            return formatted_info
+            return "".join(parts)
         else:
-            return f"Error: Could not retrieve sensor information. Status code: {response.status_code}"
+            return f"Error: Could not retrieve sensor information. Status code: {status_code}"
 
     except Exception as e:
         logger.error(f"Error in get_sensor_details: {e}")
         return f"Error getting sensor details for '{sensor_type}': {str(e)}"
 
+# query_data_batch bounds: specs per call, upstream queries run at once, and the filter keys that
+# narrow a query enough to run (max_records only trims after the whole window is downloaded)
+_BATCH_MAX_SPECS = 20
+_BATCH_CONCURRENCY = 4
+_BATCH_SELECTOR_KEYS = ("name", "plugin")
+_MATCH_ALL_PATTERNS = frozenset({"", "*", ".*", ".+"})
+
+@mcp.tool()
+async def query_data_batch(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run several Sage data queries concurrently and return the records for each.
+
+    Each spec is a dict with a "filter" dict that names a measurement or plugin (e.g.
+    {"name": "env.temperature", "vsn": "W019"}), an optional "time_range" (default "-5m") and an
+    optional "max_records" (default 100, clamped to 1-1000). At most 20 specs are accepted per call.
+    Results come back in the same order as the specs; a spec that fails gets an "error" entry instead.
+    """
+    if len(specs) > _BATCH_MAX_SPECS:
+        return [{"error": f"Too many specs ({len(specs)}); at most {_BATCH_MAX_SPECS} queries can be batched per call"}]
+
+    limiter = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def run(spec: Any) -> Dict[str, Any]:
+        filter_params = spec.get("filter") if isinstance(spec, dict) else None
+        try:
+            if not isinstance(spec, dict):
+                raise ValueError("each spec must be an object")
+            if not isinstance(filter_params, dict) or not any(
+                str(filter_params.get(key) or "").strip() not in _MATCH_ALL_PATTERNS for key in _BATCH_SELECTOR_KEYS
+            ):
+                # Without a measurement or plugin selector the query would pull everything in the window
+                raise ValueError("'filter' must be an object with a specific 'name' or 'plugin'")
+            validated_time = TimeRange(value=spec.get("time_range", "-5m"))
+            max_records = max(1, min(int(spec.get("max_records", 100)), 1000))
+
+            start, end = parse_time_range(validated_time)
+            async with limiter:
+                df = await SageDataService.query_data_async(
+                    start, end, dict(filter_params), max_records=max_records
+                )
+            records = _json_loads(df.to_json(orient="records", date_format="iso")) if not df.empty else []
+            return {"filter": filter_params, "count": len(records), "records": records}
+        except Exception as e:
+            logger.error(f"Error in batch query {spec!r}: {e}")
+            return {"filter": filter_params, "error": str(e)}
+
+    return list(await asyncio.gather(*(run(spec) for spec in specs)))
+
 # ----------------------------------------
 # 3. JOB SUBMISSION TOOLS
 # ----------------------------------------
@@ -924,7 +1257,6 @@ def submit_sage_job(
             science_rules=science_rules.split(",") if science_rules else []
         )
 
-        job_service = SageJobService(config=SageConfig())
         success, result = job_service.submit_job(job)
 
         if success:
@@ -941,6 +1273,64 @@ def check_job_status(job_id: str) -> str:
     """Check the status of a submitted Sage job"""
     return job_service.check_job_status(job_id)
 
+# Smart job name to plugin pattern mapping
+_JOB_TO_PLUGIN_PATTERNS = {
+    # Map common job name patterns to actual plugin patterns
+    "audio": [".*audio.*", ".*sage-audio.*"],
+    "air-quality": [".*air-quality.*", ".*airquality.*"],
+    "cloud": [".*cloud.*"],
+    "image": [".*image.*", ".*sampler.*"],
+    "camera": [".*camera.*", ".*imagesampler.*"],
+    "sound": [".*sound.*", ".*audio.*"],
+    "weather": [".*weather.*", ".*wxt.*"],
+    "rain": [".*rain.*", ".*raingauge.*"],
+    "temperature": [".*temperature.*", ".*temp.*"],
+    "motion": [".*motion.*"],
+    "ptz": [".*ptz.*"],
+    "yolo": [".*yolo.*"],
+    "bird": [".*bird.*", ".*avian.*"],
+    "mobotix": [".*mobotix.*"]
+}
+# Finds every keyword occurring anywhere in a job name (the lookahead lets matches overlap)
+_JOB_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, _JOB_TO_PLUGIN_PATTERNS)) + "))", re.IGNORECASE
+)
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+@functools.lru_cache(maxsize=512)
+def _job_plugin_filter(job_name: str) -> str:
+    """Server-side plugin regex for a job name: the name itself plus patterns for any known job keywords"""
+    plugin_patterns = []
+
+    # First, try exact job name match
+    if not job_name.startswith('.*'):
+        plugin_patterns.append(f".*{job_name}.*")
+
+    # Then, try to match based on job type keywords
+    keywords = {match.lower() for match in _JOB_KEYWORD_RE.findall(job_name)}
+    for keyword, patterns in _JOB_TO_PLUGIN_PATTERNS.items():
+        if keyword in keywords:
+            plugin_patterns.extend(patterns)
+
+    # If we found patterns, use them; otherwise fall back to the original logic
+    if plugin_patterns:
+        # Remove duplicates while preserving order
+        return '|'.join(dict.fromkeys(plugin_patterns))
+    if '|' in job_name:
+        return '|'.join(part for part in (p.strip() for p in job_name.split('|')) if part)
+    return _normalize_plugin_pattern(job_name)
+
+
+@functools.lru_cache(maxsize=512)
+def _job_broad_filter(job_name: str) -> str:
+    """Looser plugin regex matching any word of three or more characters from the job name"""
+    # Skip very short words
+    return '|'.join(f".*{word}.*" for word in _WORD_RE.findall(job_name.lower()) if len(word) > 2)
+
+
 @mcp.tool()
 def query_job_data(
     job_name: str,
@@ -955,64 +1345,14 @@ def query_job_data(
 
         logger.info(f"Querying data for job: {job_name} on node: {validated_node or 'all'}")
 
-        # Smart job name to plugin pattern mapping
-        job_to_plugin_patterns = {
-            # Map common job name patterns to actual plugin patterns
-            "audio": [".*audio.*", ".*sage-audio.*"],
-            "air-quality": [".*air-quality.*", ".*airquality.*"],
-            "cloud": [".*cloud.*"],
-            "image": [".*image.*", ".*sampler.*"],
-            "camera": [".*camera.*", ".*imagesampler.*"],
-            "sound": [".*sound.*", ".*audio.*"],
-            "weather": [".*weather.*", ".*wxt.*"],
-            "rain": [".*rain.*", ".*raingauge.*"],
-            "temperature": [".*temperature.*", ".*temp.*"],
-            "motion": [".*motion.*"],
-            "ptz": [".*ptz.*"],
-            "yolo": [".*yolo.*"],
-            "bird": [".*bird.*", ".*avian.*"],
-            "mobotix": [".*mobotix.*"]
-        }
-
         # Build filter parameters with intelligent pattern matching
-        filter_params = {}
-        plugin_patterns = []
-
-        # First, try exact job name match
-        if not job_name.startswith('.*'):
-            plugin_patterns.append(f".*{job_name}.*")
-
-        # Then, try to match based on job type keywords
-        job_lower = job_name.lower()
-        for keyword, patterns in job_to_plugin_patterns.items():
-            if keyword in job_lower:
-                plugin_patterns.extend(patterns)
-                logger.info(f"Detected job type '{keyword}' in job name, adding patterns: {patterns}")
-
-        # If we found patterns, use them; otherwise fall back to the original logic
-        if plugin_patterns:
-            # Remove duplicates while preserving order
-            unique_patterns = []
-            for pattern in plugin_patterns:
-                if pattern not in unique_patterns:
-                    unique_patterns.append(pattern)
-            filter_params["plugin"] = '|'.join(unique_patterns)
-        else:
-            # Fallback to original logic
-            if '|' in job_name:
-                patterns = []
-                for part in job_name.split('|'):
-                    part = part.strip()
-                    if part:
-                        patterns.append(part)
-                filter_params["plugin"] = '|'.join(patterns)
-            else:
-                pattern = job_name
-                if not pattern.startswith('.*'):
-                    pattern = f".*{pattern}"
-                if not pattern.endswith('.*'):
-                    pattern = f"{pattern}.*"
-                filter_params["plugin"] = pattern
+        filter_params = {"plugin": _job_plugin_filter(job_name)}
+        # Logged here rather than in the cached lookup so it appears on every query
+        if logger.isEnabledFor(logging.INFO):
+            keywords = {match.lower() for match in _JOB_KEYWORD_RE.findall(job_name)}
+            for keyword, patterns in _JOB_TO_PLUGIN_PATTERNS.items():
+                if keyword in keywords:
+                    logger.info(f"Detected job type '{keyword}' in job name, adding patterns: {patterns}")
 
         if validated_node:
             filter_params["vsn"] = str(validated_node)
@@ -1025,74 +1365,60 @@ def query_job_data(
         # Query the data
         start, end = parse_time_range(validated_time)
 
-        df = data_service.query_data(start, end, filter_params)
+        df = data_service.query_data(start, end, filter_params, columns=_SUMMARY_COLUMNS)
 
         if df.empty:
             # If no data found with smart matching, try a broader search
             logger.info("No data found with smart matching, trying broader search...")
-            broader_patterns = []
+            broader_filter = _job_broad_filter(job_name)
 
-            # Extract keywords from job name for broader search
-            import re
-            words = re.findall(r'\w+', job_name.lower())
-            for word in words:
-                if len(word) > 2:  # Skip very short words
-                    broader_patterns.append(f".*{word}.*")
-
-            if broader_patterns:
-                filter_params["plugin"] = '|'.join(broader_patterns)
+            if broader_filter:
+                filter_params["plugin"] = broader_filter
                 logger.info(f"Trying broader search with patterns: {filter_params['plugin']}")
-                df = data_service.query_data(start, end, filter_params)
+                df = data_service.query_data(start, end, filter_params, columns=_SUMMARY_COLUMNS)
 
             if df.empty:
                 return f"No data found for job '{job_name}' in the last {validated_time}. The job may still be starting up or not producing data yet.\n\nTip: Try using search_measurements() to see what plugins are actually running on this node."
 
         # Format results
-        result = f"Job Data Summary for '{job_name}' (last {validated_time}):\n\n"
+        parts = [f"Job Data Summary for '{job_name}' (last {validated_time}):\n\n"]
 
-        # Basic stats
+        # Basic stats; one value_counts pass per column yields both the distinct values and their number
         total_records = len(df)
-        unique_nodes = df['meta.vsn'].nunique() if 'meta.vsn' in df.columns else 0
-        unique_plugins = df['plugin'].nunique() if 'plugin' in df.columns else 0
-        unique_measurements = df['name'].nunique() if 'name' in df.columns else 0
+        distinct = {
+            column: df[column].value_counts(sort=False).index
+            for column in ('meta.vsn', 'plugin', 'name') if column in df.columns
+        }
+        unique_nodes = len(distinct.get('meta.vsn', ()))
+        unique_plugins = len(distinct.get('plugin', ()))
+        unique_measurements = len(distinct.get('name', ()))
 
-        result += f"Total records: {total_records}\n"
-        result += f"Nodes reporting: {unique_nodes}\n"
-        result += f"Plugins active: {unique_plugins}\n"
-        result += f"Measurement types: {unique_measurements}\n"
+        parts.append(f"Total records: {total_records}\n")
+        parts.append(f"Nodes reporting: {unique_nodes}\n")
+        parts.append(f"Plugins active: {unique_plugins}\n")
+        parts.append(f"Measurement types: {unique_measurements}\n")
 
         # Show plugins and measurements found
-        if 'plugin' in df.columns:
-            plugins = sorted(df['plugin'].unique())
-            result += f"\nPlugins: {', '.join(plugins)}\n"
+        if 'plugin' in distinct:
+            plugins = sorted(distinct['plugin'])
+            parts.append(f"\nPlugins: {', '.join(plugins)}\n")
 
-        if 'name' in df.columns:
-            measurements = sorted(df['name'].unique())
-            result += f"Measurements: {', '.join(measurements)}\n"
+        if 'name' in distinct:
+            measurements = sorted(distinct['name'])
+            parts.append(f"Measurements: {', '.join(measurements)}\n")
 
         # Show time range
         if 'timestamp' in df.columns:
             latest = safe_timestamp_format(df['timestamp'].max())
             earliest = safe_timestamp_format(df['timestamp'].min())
-            result += f"\nTime range: {earliest} to {latest}\n"
+            parts.append(f"\nTime range: {earliest} to {latest}\n")
 
         # Show sample of recent data
-        result += "\nRecent data sample:\n"
-        recent = df.sort_values('timestamp', ascending=False).head(5)
-        for _, row in recent.iterrows():
-            timestamp = safe_timestamp_format(row.get('timestamp', 'N/A'))
-            node = row.get('meta.vsn', 'N/A')
-            name = row.get('name', 'N/A')
-            plugin = row.get('plugin', 'N/A')
-            value = row.get('value', 'N/A')
-            result += f"  {timestamp} | Node {node} | {name}"
-            if isinstance(value, (int, float)):
-                result += f" | Value: {value:.2f}"
-            elif value != 'N/A':
-                result += f" | Value: {value}"
-            result += f" | Plugin: {plugin}\n"
+        parts.append("\nRecent data sample:\n")
+        for ts, node, name, value, plugin in _recent_samples(df, 5, ('meta.vsn', 'name', 'value', 'plugin')):
+            parts.append(f"  {safe_timestamp_format(ts)} | Node {node} | {name}{_format_sample_value(value)} | Plugin: {plugin}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error querying job data: {e}")
@@ -1160,82 +1486,109 @@ def submit_plugin_job(
 # GEOGRAPHICAL QUERY TOOLS
 # ----------------------------------------
 
+# Region names and the state names/abbreviations that place a node in them
+_REGIONS = {
+    "east coast": ["new york", "massachusetts", "rhode island", "connecticut", "new jersey",
+                  "delaware", "maryland", "virginia", "north carolina", "south carolina",
+                  "georgia", "florida", "pennsylvania", "washington dc", "washington d.c.",
+                  "maine", "new hampshire", "vermont", "ny", "ma", "ri", "ct", "nj", "de",
+                  "md", "va", "nc", "sc", "ga", "fl", "pa", "dc", "me", "nh", "vt", "eastern"],
+    "west coast": ["california", "oregon", "washington", "ca", "or", "wa", "western"],
+    "midwest": ["illinois", "indiana", "michigan", "ohio", "wisconsin", "minnesota",
+               "iowa", "missouri", "kansas", "nebraska", "south dakota", "north dakota",
+               "il", "in", "mi", "oh", "wi", "mn", "ia", "mo", "ks", "ne", "sd", "nd", "chicago"],
+    "southwest": ["arizona", "new mexico", "texas", "oklahoma", "nevada", "az", "nm", "tx", "ok", "nv"],
+    "southeast": ["alabama", "mississippi", "louisiana", "tennessee", "kentucky", "al", "ms", "la", "tn", "ky"]
+}
+# One precompiled alternation per region; states must match as whole words, so short
+# abbreviations like "in" or "or" don't match inside other words
+_REGION_PATTERNS = {
+    region: re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, states)) + r")(?!\w)")
+    for region, states in _REGIONS.items()
+}
+
+# (manifest list, lowercased frame, location -> matching nodes) for the most recently seen manifest
+_MANIFEST_INDEX: Tuple[Any, Optional[pd.DataFrame], Dict[str, List[Dict[str, Any]]]] = (None, None, {})
+_MAX_LOCATION_MATCHES = 256
+
+
+def _manifest_index(nodes: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, List[Dict[str, Any]]]]:
+    """Lowercased address/location/name columns of the manifest and its location match memo,
+    both rebuilt only when the manifest changes"""
+    global _MANIFEST_INDEX
+    cached_nodes, frame, matches = _MANIFEST_INDEX
+    if cached_nodes is not nodes:
+        # Rows are kept in VSN order, so filtered matches come out already sorted
+        order = sorted(range(len(nodes)), key=lambda i: nodes[i].get('vsn', ''))
+        ordered = [nodes[i] for i in order]
+        frame = pd.DataFrame({
+            'position': order,
+            'vsn': [node.get('vsn', 'Unknown') for node in ordered],
+            'address': [node.get('address', '') for node in ordered],
+            'location': [node.get('location', '') for node in ordered],
+            'name': [node.get('name', '') for node in ordered],
+        }, dtype=object)
+        for col in ('address', 'location', 'name'):
+            frame[col] = frame[col].str.lower().fillna('')
+        matches = {}
+        _MANIFEST_INDEX = (nodes, frame, matches)
+    return frame, matches
+
+
+def _match_location(nodes: List[Dict[str, Any]], location_lower: str) -> List[Dict[str, Any]]:
+    """Manifest entries in a lowercased city or region, sorted by VSN and memoized per manifest"""
+    frame, matches = _manifest_index(nodes)
+    cached = matches.get(location_lower)
+    if cached is not None:
+        return cached
+
+    # Check if the location is a region
+    region_pattern = _REGION_PATTERNS.get(location_lower)
+    is_region = region_pattern is not None
+
+    # Use substring match for city
+    city_match = (frame['address'].str.contains(location_lower, regex=False)
+                  | frame['location'].str.contains(location_lower, regex=False))
+    if is_region:
+        region_match = (frame['address'].str.contains(region_pattern)
+                        | frame['location'].str.contains(region_pattern)
+                        | frame['name'].str.contains(region_pattern))
+        included = region_match
+    else:
+        region_match = pd.Series(False, index=frame.index)
+        included = city_match
+    matching_nodes = [nodes[i] for i in frame['position'][included]]
+
+    # Log debug info for all nodes considered
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Node filtering debug info:")
+        for vsn, address, node_location, city, region, include in zip(
+            frame['vsn'], frame['address'], frame['location'], city_match, region_match, included
+        ):
+            logger.debug("Node %s: address='%s', location='%s', city_match=%s, region_match=%s, included=%s",
+                         vsn, address, node_location, city, region, include)
+
+    if len(matches) >= _MAX_LOCATION_MATCHES:
+        matches.clear()
+    matches[location_lower] = matching_nodes
+    return matching_nodes
+
+
 def _get_nodes_by_location_internal(location: str):
     """Internal helper function to get nodes by location. Returns (matching_nodes, error_message)"""
     try:
         logger.info(f"Getting nodes in location: {location}")
-        response = requests.get(SAGE_MANIFESTS_URL)
-        if response.status_code != 200:
-            return None, f"Error: Could not retrieve node list. Status code: {response.status_code}"
-        nodes = response.json()
+        status_code, nodes = _get_sage_json(SAGE_MANIFESTS_URL)
+        if status_code != 200:
+            return None, f"Error: Could not retrieve node list. Status code: {status_code}"
         if not nodes:
             return None, "No nodes found in the database."
 
-        location_lower = location.lower().strip()
-
-        # Define region mappings
-        regions = {
-            "east coast": ["new york", "massachusetts", "rhode island", "connecticut", "new jersey",
-                          "delaware", "maryland", "virginia", "north carolina", "south carolina",
-                          "georgia", "florida", "pennsylvania", "washington dc", "washington d.c.",
-                          "maine", "new hampshire", "vermont", "ny", "ma", "ri", "ct", "nj", "de",
-                          "md", "va", "nc", "sc", "ga", "fl", "pa", "dc", "me", "nh", "vt", "eastern"],
-            "west coast": ["california", "oregon", "washington", "ca", "or", "wa", "western"],
-            "midwest": ["illinois", "indiana", "michigan", "ohio", "wisconsin", "minnesota",
-                       "iowa", "missouri", "kansas", "nebraska", "south dakota", "north dakota",
-                       "il", "in", "mi", "oh", "wi", "mn", "ia", "mo", "ks", "ne", "sd", "nd", "chicago"],
-            "southwest": ["arizona", "new mexico", "texas", "oklahoma", "nevada", "az", "nm", "tx", "ok", "nv"],
-            "southeast": ["alabama", "mississippi", "louisiana", "tennessee", "kentucky", "al", "ms", "la", "tn", "ky"]
-        }
-
-        # Check if the location is a region
-        is_region = False
-        target_states = []
-        for region, states in regions.items():
-            if location_lower == region:
-                is_region = True
-                target_states.extend(states)
-                break
-
-        matching_nodes = []
-        debug_info = []
-        for node in nodes:
-            node_vsn = node.get('vsn', 'Unknown')
-            node_address = node.get('address', '').lower()
-            node_location = node.get('location', '').lower()
-            node_name = node.get('name', '').lower()
-
-            # Use substring match for city
-            city_match = (location_lower in node_address) or (location_lower in node_location)
-            region_match = False
-            if is_region:
-                for state in target_states:
-                    if state in node_address or state in node_location or state in node_name:
-                        region_match = True
-                        break
-
-            include = (is_region and region_match) or (not is_region and city_match)
-            debug_info.append({
-                'vsn': node_vsn,
-                'address': node_address,
-                'location': node_location,
-                'city_match': bool(city_match),
-                'region_match': bool(region_match),
-                'included': include
-            })
-            if include:
-                matching_nodes.append(node)
-
-        # Log debug info for all nodes considered
-        logger.info("Node filtering debug info:")
-        for info in debug_info:
-            logger.info(f"Node {info['vsn']}: address='{info['address']}', location='{info['location']}', city_match={info['city_match']}, region_match={info['region_match']}, included={info['included']}")
-
+        matching_nodes = list(_match_location(nodes, location.lower().strip()))
         if not matching_nodes:
             logger.info(f"No nodes matched for location '{location}'.")
             return None, f"No Sage nodes found in {location}."
 
-        matching_nodes.sort(key=lambda x: x.get('vsn', ''))
         logger.info(f"Included nodes for location '{location}': {[n.get('vsn', 'Unknown') for n in matching_nodes]}")
         return matching_nodes, None
     except Exception as e:
@@ -1250,24 +1603,24 @@ def get_nodes_by_location(location: str) -> str:
     if error_message:
         return error_message
 
-    result = f"Found {len(matching_nodes)} nodes in or near {location}:\n\n"
+    parts = [f"Found {len(matching_nodes)} nodes in or near {location}:\n\n"]
     for node in matching_nodes:
         vsn = node.get('vsn', 'Unknown')
         name = node.get('name', 'Unknown')
         address = node.get('address', 'Unknown location')
         phase = node.get('phase', 'Unknown phase')
-        result += f"- Node {vsn}: {name}\n"
-        result += f"  Location: {address}\n"
-        result += f"  Status: {phase}\n"
+        parts.append(f"- Node {vsn}: {name}\n")
+        parts.append(f"  Location: {address}\n")
+        parts.append(f"  Status: {phase}\n")
         sensors = node.get('sensors', [])
         if sensors:
             sensor_names = [s.get('name', 'Unknown') for s in sensors]
-            result += f"  Sensors: {', '.join(sensor_names[:5])}"
+            parts.append(f"  Sensors: {', '.join(sensor_names[:5])}")
             if len(sensor_names) > 5:
-                result += f" and {len(sensor_names) - 5} more"
-            result += "\n"
-        result += "\n"
-    return result
+                parts.append(f" and {len(sensor_names) - 5} more")
+            parts.append("\n")
+        parts.append("\n")
+    return "".join(parts)
 
 @mcp.tool()
 def get_measurement_stat_by_location(
@@ -1308,6 +1661,9 @@ def get_measurement_stat_by_location(
             }
         }
         logger.info(f"Getting {stat} of {measurement_type} for location: {location}")
+        # Reject an unknown statistic before fetching any data for it
+        if stat not in ("min", "max", "avg"):
+            return f"Error: Unknown stat '{stat}'. Use 'min', 'max', or 'avg'."
         validated_time = TimeRange(value=time_range)
         # Get all nodes in the specified location
         matching_nodes, error_message = _get_nodes_by_location_internal(location)
@@ -1322,58 +1678,62 @@ def get_measurement_stat_by_location(
             logger.info(f"Limiting query from {len(node_ids)} to 20 nodes for performance")
             node_ids = node_ids[:20]
         logger.info(f"Querying {measurement_type} data for {len(node_ids)} nodes in {location}")
-        all_data = []
         is_raingauge = measurement_type.startswith("env.raingauge")
-        for node_id in node_ids:
-            if is_raingauge:
-                # Use a regex plugin filter for rain gauge queries
-                filter_params = {
-                    "plugin": ".*plugin-raingauge.*",
-                    "vsn": node_id
-                }
-                logger.info(f"Querying Sage data with plugin regex filter: {filter_params}")
-                start, end = parse_time_range(validated_time)
+        start, end = parse_time_range(validated_time)
+
+        # Query all nodes at once with a vsn alternation; each node used to get its own
+        # 1000-record cap, so keep the same total budget for the combined query
+        vsn_pattern = "|".join(re.escape(node_id) for node_id in node_ids)
+        max_records = 1000 * len(node_ids)
 
-                df = data_service.query_data(start, end, filter_params)
-                logger.info(f"[Rain plugin] Raw df shape: {df.shape}, columns: {list(df.columns) if not df.empty else 'EMPTY'}")
+        if is_raingauge:
+            # Use a regex plugin filter for rain gauge queries
+            filter_params = {
+                "plugin": ".*plugin-raingauge.*",
+                "vsn": vsn_pattern
+            }
+            logger.info(f"Querying Sage data with plugin regex filter: {filter_params}")
+            df = data_service.query_data(start, end, filter_params, max_records=max_records)
+            logger.info(f"[Rain plugin] Raw df shape: {df.shape}, columns: {list(df.columns) if not df.empty else 'EMPTY'}")
+            frames = []
+            reporting_nodes = set()
+            if not df.empty:
                 # Now filter for the measurement_type in the DataFrame
-                if not df.empty:
-                    df2 = df[df['name'] == measurement_type]
-                    logger.info(f"[Rain plugin] After measurement filter: {df2.shape}, columns: {list(df2.columns) if not df2.empty else 'EMPTY'}")
-                    if not df2.empty:
-                        df2['node_id'] = node_id
-                        all_data.append(df2)
-                # Fallback: if no data found, try querying by measurement name only
-                if df.empty:
-                    fallback_params = {
-                        "name": measurement_type,
-                        "vsn": node_id
-                    }
-                    logger.info(f"[Rain fallback] Querying Sage data with fallback filter: {fallback_params}")
-                    start, end = parse_time_range(validated_time)
-                    df_fallback = data_service.query_data(start, end, fallback_params)
-                    logger.info(f"[Rain fallback] Fallback df shape: {df_fallback.shape}, columns: {list(df_fallback.columns) if not df_fallback.empty else 'EMPTY'}")
-                    if not df_fallback.empty:
-                        df_fallback['node_id'] = node_id
-                        all_data.append(df_fallback)
-            else:
-                # Default logic for other measurement types
-                filter_params = {
+                frames.append(df[df['name'] == measurement_type])
+                reporting_nodes = set(df['meta.vsn'].unique())
+                logger.info(f"[Rain plugin] After measurement filter: {frames[0].shape}")
+            # Fallback: nodes with no rain plugin data are queried by measurement name only
+            missing_nodes = [node_id for node_id in node_ids if node_id not in reporting_nodes]
+            if missing_nodes:
+                fallback_params = {
                     "name": measurement_type,
-                    "vsn": node_id
+                    "vsn": "|".join(re.escape(node_id) for node_id in missing_nodes)
                 }
-                if sensor_type:
-                    filter_params["sensor"] = sensor_type
-                logger.info(f"Querying Sage data with filter: {filter_params}")
-                start, end = parse_time_range(validated_time)
-
-                df = data_service.query_data(start, end, filter_params)
-                if not df.empty:
-                    df['node_id'] = node_id
-                    all_data.append(df)
-        if not all_data:
+                logger.info(f"[Rain fallback] Querying Sage data with fallback filter: {fallback_params}")
+                df_fallback = data_service.query_data(start, end, fallback_params, max_records=1000 * len(missing_nodes))
+                logger.info(f"[Rain fallback] Fallback df shape: {df_fallback.shape}, columns: {list(df_fallback.columns) if not df_fallback.empty else 'EMPTY'}")
+                frames.append(df_fallback)
+            frames = [frame for frame in frames if not frame.empty]
+            combined_data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        else:
+            # Default logic for other measurement types
+            filter_params = {
+                "name": measurement_type,
+                "vsn": vsn_pattern
+            }
+            if sensor_type:
+                filter_params["sensor"] = sensor_type
+            logger.info(f"Querying Sage data with filter: {filter_params}")
+            combined_data = data_service.query_data(start, end, filter_params, max_records=max_records)
+
+        if combined_data.empty:
             return f"No {measurement_type} data found for nodes in {location} during the last {validated_time}"
-        combined_data = pd.concat(all_data, ignore_index=True)
+        # A filter expression may reference any column, so only narrow the frame without one
+        if not filter_expr:
+            combined_data = _keep_columns(combined_data, ('timestamp', 'value', 'meta.vsn'))
+        # The frame may be a shallow copy of a cached query result: assigning a new column is
+        # safe, but existing values must not be changed in place
+        combined_data['node_id'] = combined_data['meta.vsn']
         # Apply filter expression if provided
         if filter_expr:
             try:
@@ -1392,36 +1752,35 @@ def get_measurement_stat_by_location(
         if is_raingauge and measurement_type in rain_meta:
             unit = rain_meta[measurement_type]["unit"]
             desc = rain_meta[measurement_type]["desc"]
-        # Compute the requested statistic
+        # Compute the requested statistic on the raw values, reading the winning row positionally
+        vals = pd.to_numeric(filtered_data['value'], errors='coerce').to_numpy(dtype=np.float64)
         if stat == "min":
-            idx = filtered_data['value'].idxmin()
-            reading = filtered_data.loc[idx]
-            stat_val = reading['value']
-            stat_node = reading['node_id']
-            stat_time = safe_timestamp_format(reading['timestamp'])
-            stat_str = f"Minimum {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n"
-            stat_str += f"Min: {stat_val:.2f}{' ' + unit if unit else ''} measured at node {stat_node}\n  Time: {stat_time}\n  Data from {len(filtered_data)} filtered readings\n"
-            if desc:
-                stat_str += f"Description: {desc}\n"
+            i = int(np.nanargmin(vals))
+            stat_val = vals[i]
+            stat_node = filtered_data['node_id'].iat[i]
+            stat_time = safe_timestamp_format(filtered_data['timestamp'].iat[i])
+            parts = [
+                f"Minimum {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n",
+                f"Min: {stat_val:.2f}{' ' + unit if unit else ''} measured at node {stat_node}\n  Time: {stat_time}\n  Data from {len(filtered_data)} filtered readings\n",
+            ]
         elif stat == "max":
-            idx = filtered_data['value'].idxmax()
-            reading = filtered_data.loc[idx]
-            stat_val = reading['value']
-            stat_node = reading['node_id']
-            stat_time = safe_timestamp_format(reading['timestamp'])
-            stat_str = f"Maximum {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n"
-            stat_str += f"Max: {stat_val:.2f}{' ' + unit if unit else ''} measured at node {stat_node}\n  Time: {stat_time}\n  Data from {len(filtered_data)} filtered readings\n"
-            if desc:
-                stat_str += f"Description: {desc}\n"
-        elif stat == "avg":
-            stat_val = filtered_data['value'].mean()
-            stat_str = f"Average {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n"
-            stat_str += f"Avg: {stat_val:.2f}{' ' + unit if unit else ''} (from {len(filtered_data)} filtered readings)\n"
-            if desc:
-                stat_str += f"Description: {desc}\n"
+            i = int(np.nanargmax(vals))
+            stat_val = vals[i]
+            stat_node = filtered_data['node_id'].iat[i]
+            stat_time = safe_timestamp_format(filtered_data['timestamp'].iat[i])
+            parts = [
+                f"Maximum {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n",
+                f"Max: {stat_val:.2f}{' ' + unit if unit else ''} measured at node {stat_node}\n  Time: {stat_time}\n  Data from {len(filtered_data)} filtered readings\n",
+            ]
         else:
-            return f"Error: Unknown stat '{stat}'. Use 'min', 'max', or 'avg'."
-        return stat_str
+            stat_val = np.nanmean(vals)
+            parts = [
+                f"Average {measurement_type} in {location} (last {validated_time}, filter: '{filter_expr}'):\n\n",
+                f"Avg: {stat_val:.2f}{' ' + unit if unit else ''} (from {len(filtered_data)} filtered readings)\n",
+            ]
+        if desc:
+            parts.append(f"Description: {desc}\n")
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error in get_measurement_stat_by_location: {e}")
         return f"Error getting {stat} of {measurement_type} for {location}: {str(e)}"
@@ -1430,6 +1789,20 @@ def get_measurement_stat_by_location(
 # 5. PLUGIN TOOLS
 # ----------------------------------------
 
+# Ranked plugin search results, so repeated task descriptions skip re-scoring every plugin
+_PLUGIN_SEARCH_CACHE = TTLCache(maxsize=256, ttl=300)
+
+
+def _search_plugins(task: str, max_results: int = 10) -> List[Any]:
+    """plugin_registry.search_plugins, served from a short-lived cache"""
+    key = (task, max_results)
+    results = _PLUGIN_SEARCH_CACHE.get(key)
+    if results is None:
+        results = plugin_registry.search_plugins(task, max_results=max_results)
+        _PLUGIN_SEARCH_CACHE.set(key, results)
+    return results
+
+
 @mcp.tool()
 def find_plugins_for_task(task_description: str) -> str:
     """Find and recommend plugins/apps suitable for a given task description.
@@ -1449,7 +1822,7 @@ def find_plugins_for_task(task_description: str) -> str:
         logger.info(f"Searching for plugins matching task: {task_description}")
 
         # Use the improved plugin registry search
-        matching_plugins = plugin_registry.search_plugins(task, max_results=10)
+        matching_plugins = _search_plugins(task, max_results=10)
 
         if not matching_plugins:
             suggestion = "Try using different keywords or check these categories:\n"
@@ -1553,58 +1926,41 @@ def get_cloud_images(time_range: str = "-1h", node_id: str = "") -> str:
 
         # Query the data
         start, end = parse_time_range(validated_time)
-        df = data_service.query_data(start, end, filter_params)
+        df = data_service.query_data(start, end, filter_params, columns=_SUMMARY_COLUMNS)
 
         if df.empty:
             node_text = f" for node {validated_node}" if validated_node else ""
             return f"No cloud images found{node_text} in the last {validated_time}"
+        _categorize(df)
 
         # Format results
-        result = f"Cloud images found (last {validated_time}):\n\n"
+        parts = [f"Cloud images found (last {validated_time}):\n\n"]
+        plugin_summaries = list(_plugin_summaries(df)) if 'plugin' in df.columns else []
 
-        # Basic stats
+        # Basic stats; the plugins are counted from their summaries rather than another pass over the column
         total_records = len(df)
         unique_nodes = df['meta.vsn'].nunique() if 'meta.vsn' in df.columns else 0
-        unique_plugins = df['plugin'].nunique() if 'plugin' in df.columns else 0
+        unique_plugins = len(plugin_summaries)
         unique_measurements = df['name'].nunique() if 'name' in df.columns else 0
 
-        result += f"Total records: {total_records}\n"
-        result += f"Nodes reporting: {unique_nodes}\n"
-        result += f"Plugins active: {unique_plugins}\n"
-        result += f"Measurement types: {unique_measurements}\n\n"
+        parts.append(f"Total records: {total_records}\n")
+        parts.append(f"Nodes reporting: {unique_nodes}\n")
+        parts.append(f"Plugins active: {unique_plugins}\n")
+        parts.append(f"Measurement types: {unique_measurements}\n\n")
 
         # Group by plugin
-        plugins = sorted(df['plugin'].unique()) if 'plugin' in df.columns else []
-        for plugin in plugins:
-            plugin_df = df[df['plugin'] == plugin]
-            result += f"Plugin: {plugin}\n"
-
-            # Get nodes for this plugin
-            nodes = sorted(plugin_df['meta.vsn'].unique())
-            result += f"- Nodes: {', '.join(nodes)}\n"
-
-            # Get measurements
-            measurements = sorted(plugin_df['name'].unique())
-            result += f"- Measurements: {', '.join(measurements)}\n"
+        for plugin, _, nodes, measurements, recent in plugin_summaries:
+            parts.append(f"Plugin: {plugin}\n")
+            parts.append(f"- Nodes: {', '.join(nodes)}\n")
+            parts.append(f"- Measurements: {', '.join(measurements)}\n")
 
             # Show recent data samples
-            result += "- Recent data:\n"
-            recent = plugin_df.sort_values('timestamp', ascending=False).head(3)
-            for _, row in recent.iterrows():
-                timestamp = safe_timestamp_format(row['timestamp'])
-                node = row.get('meta.vsn', 'N/A')
-                name = row.get('name', 'N/A')
-                value = row.get('value', 'N/A')
-
-                result += f"  {timestamp} | Node {node} | {name}"
-                if isinstance(value, (int, float)):
-                    result += f" | Value: {value:.2f}"
-                elif value != 'N/A':
-                    result += f" | Value: {value}"
-                result += "\n"
-            result += "\n"
+            parts.append("- Recent data:\n")
+            for ts, node, name, value in _recent_samples(recent):
+                parts.append(f"  {safe_timestamp_format(ts)} | Node {node} | {name}{_format_sample_value(value)}\n")
+            parts.append("\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error getting cloud images: {e}")
@@ -1621,29 +1977,8 @@ def get_image_data(time_range: str = "-1h", node_id: str = "", plugin_pattern: s
         if validated_node:
             logger.info(f"Filtering for node: {validated_node}")
 
-        # Build filter parameters with better pattern matching
-        filter_params = {}
-
-        # Handle different pattern types for plugin pattern
-        if '|' in plugin_pattern:
-            # For OR conditions, ensure each part has proper wildcards
-            patterns = []
-            for part in plugin_pattern.split('|'):
-                part = part.strip()
-                if not part.startswith('.*'):
-                    part = f".*{part}"
-                if not part.endswith('.*'):
-                    part = f"{part}.*"
-                patterns.append(part)
-            filter_params["plugin"] = '|'.join(patterns)
-        else:
-            # Single pattern - ensure it has proper wildcards
-            pattern = plugin_pattern
-            if not pattern.startswith('.*'):
-                pattern = f".*{pattern}"
-            if not pattern.endswith('.*'):
-                pattern = f"{pattern}.*"
-            filter_params["plugin"] = pattern
+        # Build filter parameters; each '|' alternative of the plugin pattern gets '.*' wildcards
+        filter_params = {"plugin": _normalize_plugin_pattern(plugin_pattern)}
 
         if validated_node:
             filter_params["vsn"] = str(validated_node)
@@ -1652,64 +1987,51 @@ def get_image_data(time_range: str = "-1h", node_id: str = "", plugin_pattern: s
 
         # Query image data
         start, end = parse_time_range(validated_time)
-        df = data_service.query_data(start, end, filter_params)
+        df = data_service.query_data(start, end, filter_params, columns=_SUMMARY_COLUMNS)
 
         if df.empty:
             node_text = f" for node {validated_node}" if validated_node else ""
             pattern_text = f" matching pattern '{plugin_pattern}'" if plugin_pattern != ".*" else ""
             return f"No image data found{node_text}{pattern_text} in the last {validated_time}"
+        _categorize(df)
 
         # Format results
-        result = f"Image data found (last {validated_time}):\n\n"
+        parts = [f"Image data found (last {validated_time}):\n\n"]
+        plugin_summaries = list(_plugin_summaries(df)) if 'plugin' in df.columns else []
 
-        # Get basic stats
+        # Get basic stats; the plugins are counted from their summaries rather than another pass over the column
         total_records = len(df)
         unique_nodes = df['meta.vsn'].nunique() if 'meta.vsn' in df.columns else 0
-        unique_plugins = df['plugin'].nunique() if 'plugin' in df.columns else 0
+        unique_plugins = len(plugin_summaries)
 
-        result += f"Total records: {total_records}\n"
-        result += f"Nodes reporting: {unique_nodes}\n"
-        result += f"Plugins active: {unique_plugins}\n"
+        parts.append(f"Total records: {total_records}\n")
+        parts.append(f"Nodes reporting: {unique_nodes}\n")
+        parts.append(f"Plugins active: {unique_plugins}\n")
 
         # Show plugins found
         if 'plugin' in df.columns:
-            plugins = sorted(df['plugin'].unique())
-            result += f"\nPlugins: {', '.join(plugins)}\n"
+            parts.append(f"\nPlugins: {', '.join(summary[0] for summary in plugin_summaries)}\n")
 
         # Show time range
         if 'timestamp' in df.columns:
             latest = safe_timestamp_format(df['timestamp'].max())
             earliest = safe_timestamp_format(df['timestamp'].min())
-            result += f"Data range: {earliest} to {latest}\n"
+            parts.append(f"Data range: {earliest} to {latest}\n")
 
         # Show sample of recent data by plugin
         if 'plugin' in df.columns:
-            result += f"\nRecent data by plugin:\n"
-            for plugin in plugins:
-                plugin_df = df[df['plugin'] == plugin]
-                result += f"\nPlugin: {plugin}\n"
-                result += f"  Records: {len(plugin_df)}\n"
-
-                # Get nodes for this plugin
-                nodes = sorted(plugin_df['meta.vsn'].unique())
-                result += f"  Nodes: {', '.join(nodes)}\n"
+            parts.append("\nRecent data by plugin:\n")
+            for plugin, records, nodes, _, recent in plugin_summaries:
+                parts.append(f"\nPlugin: {plugin}\n")
+                parts.append(f"  Records: {records}\n")
+                parts.append(f"  Nodes: {', '.join(nodes)}\n")
 
                 # Show sample of recent data for this plugin
-                recent_data = plugin_df.sort_values('timestamp', ascending=False).head(3)
-                result += "  Recent data:\n"
-                for _, row in recent_data.iterrows():
-                    timestamp = safe_timestamp_format(row.get('timestamp', 'N/A'))
-                    node = row.get('meta.vsn', 'N/A')
-                    name = row.get('name', 'N/A')
-                    value = row.get('value', 'N/A')
-                    result += f"    {timestamp} | Node: {node} | {name}"
-                    if isinstance(value, (int, float)):
-                        result += f" | Value: {value:.2f}"
-                    elif value != 'N/A':
-                        result += f" | Value: {value}"
-                    result += "\n"
+                parts.append("  Recent data:\n")
+                for ts, node, name, value in _recent_samples(recent):
+                    parts.append(f"    {safe_timestamp_format(ts)} | Node: {node} | {name}{_format_sample_value(value)}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         logger.error(f"Error getting image data: {e}")
@@ -1762,10 +2084,6 @@ def submit_multi_plugin_job(
     '{"preset": "ml_suite", "cloud_cover_interval": 10, "sound_event_interval": 10, "avian_monitoring_interval": 5}'
     """
     try:
-        # Initialize job service
-        config = SageConfig()
-        job_service = SageJobService(config)
-
         # Parse node list
         node_list = [node.strip() for node in nodes.split(',') if node.strip()]
         if not node_list:
@@ -1790,6 +2108,7 @@ def submit_multi_plugin_job(
 def ask_sage_docs(question: str) -> str:
     """Ask questions about Sage documentation and get comprehensive answers with examples and links"""
     try:
+        docs_helper = get_docs_helper()
         if not question.strip():
             return "Please provide a specific question about SAGE. " + docs_helper.list_faq_topics()
 
@@ -1803,6 +2122,7 @@ def ask_sage_docs(question: str) -> str:
 def sage_faq(topic: str = "") -> str:
     """Get answers to frequently asked questions about SAGE. Available topics: getting_started, plugin_development, data_access, job_submission, sensors, troubleshooting, node_access"""
     try:
+        docs_helper = get_docs_helper()
         if not topic:
             return docs_helper.list_faq_topics()
 
@@ -1824,7 +2144,7 @@ def search_sage_docs(query: str, max_results: int = 5) -> str:
         if not query.strip():
             return "Please provide a search query. Examples: 'pluginctl commands', 'data API', 'job submission'"
 
-        results = docs_helper.search_docs(query, max_results)
+        results = get_docs_helper().search_docs(query, max_results)
 
         if not results:
             return f"No documentation found for '{query}'. Try different keywords or check the FAQ topics."
@@ -1842,6 +2162,36 @@ def search_sage_docs(query: str, max_results: int = 5) -> str:
         logger.error(f"Error searching documentation: {e}")
         return f"Error searching documentation: {str(e)}"
 
+# Response templates for create_plugin, built once at import
+_PLUGIN_SUCCESS_TMPL = """Plugin '{name}' created successfully at {path}
+
+IMPORTANT DEPLOYMENT INFORMATION:
+-------------------------------
+1. Base Image: For ML plugins requiring GPU, use:
+   FROM waggle/plugin-base:1.1.1-ml-cuda10.2-l4t
+
+2. Deployment Steps:
+   a) Package the plugin:
+      tar -czf {name}.tar.gz {name}/
+
+   b) Transfer to node:
+      scp {name}.tar.gz waggle-dev-node-WXXX:~
+
+   c) SSH into node:
+      ssh waggle-dev-node-WXXX
+
+   d) Extract and deploy:
+      mkdir -p {name}
+      cd {name}
+      tar -xzf ../{name}.tar.gz --strip-components=1
+      sudo pluginctl build .
+      sudo pluginctl run .
+
+Note: Replace WXXX with your target node ID (e.g., W0B6).
+The sudo commands will work without a password on Sage nodes."""
+
+_PLUGIN_ERROR_TMPL = "Error creating plugin: {error}"
+
 @mcp.tool()
 def create_plugin(
     description: str,
@@ -1864,8 +2214,8 @@ def create_plugin(
                 camera=use_camera,
                 environmental_sensors=use_env_sensors,
                 audio=use_audio,
-                python_packages=packages.split(",") if packages else [],
-                system_packages=system_deps.split(",") if system_deps else []
+                python_packages=_CSV_SPLIT.split(packages.strip()) if packages.strip() else [],
+                system_packages=_CSV_SPLIT.split(system_deps.strip()) if system_deps.strip() else []
             )
         )
 
@@ -1874,36 +2224,11 @@ def create_plugin(
         plugin_path = generator.generate_plugin(template)
 
         # Return success message with deployment instructions
-        return f"""Plugin '{name}' created successfully at {plugin_path}
-
-IMPORTANT DEPLOYMENT INFORMATION:
--------------------------------
-1. Base Image: For ML plugins requiring GPU, use:
-   FROM waggle/plugin-base:1.1.1-ml-cuda10.2-l4t
-
-2. Deployment Steps:
-   a) Package the plugin:
-      tar -czf {name}.tar.gz {name}/
-
-   b) Transfer to node:
-      scp {name}.tar.gz waggle-dev-node-WXXX:~
-
-   c) SSH into node:
-      ssh waggle-dev-node-WXXX
-
-   d) Extract and deploy:
-      mkdir -p {name}
-      cd {name}
-      tar -xzf ../{name}.tar.gz --strip-components=1
-      sudo pluginctl build .
-      sudo pluginctl run .
-
-Note: Replace WXXX with your target node ID (e.g., W0B6).
-The sudo commands will work without a password on Sage nodes."""
+        return _PLUGIN_SUCCESS_TMPL.format(name=name, path=plugin_path)
 
     except Exception as e:
         logger.error(f"Error creating plugin: {e}")
-        return f"Error creating plugin: {str(e)}"
+        return _PLUGIN_ERROR_TMPL.format(error=e)
 
 # ----------------------------------------
 # 6. ANALYTICS REST API ENDPOINTS (Admin Only)
@@ -2177,17 +2502,13 @@ async def proxy_image(request):
         if not url.startswith("https://storage.sagecontinuum.org/"):
             raise HTTPException(status_code=400, detail="Invalid URL: Only Sage storage URLs are allowed")
 
-        # Prepare authentication headers
-        headers = {}
+        # Prepare authentication headers; images are already compressed, so ask for them unencoded
+        # rather than paying to decompress a gzip/deflate body
+        headers = {"Accept-Encoding": "identity"}
 
         # 1) Try environment variables first
-        sage_user = os.getenv("SAGE_USER")
-        sage_pass = os.getenv("SAGE_PASS")
-
-        if sage_user and sage_pass:
-            import base64
-            credentials = base64.b64encode(f"{sage_user}:{sage_pass}".encode()).decode()
-            headers["Authorization"] = f"Basic {credentials}"
+        if _ENV_BASIC_AUTH:
+            headers["Authorization"] = _ENV_BASIC_AUTH
             logger.info("Using Sage credentials from environment variables")
         # 2) Use incoming Authorization header from client (Bearer token from MCP)
         elif incoming_auth:
@@ -2198,10 +2519,8 @@ async def proxy_image(request):
 
                 if ':' in bearer_token:
                     # Token in username:password format (like plebbyd:token)
-                    username, password = bearer_token.split(':', 1)
-                    import base64
-                    credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-                    headers["Authorization"] = f"Basic {credentials}"
+                    username = bearer_token.split(':', 1)[0]
+                    headers["Authorization"] = _basic_auth_header(bearer_token)
                     logger.info(f"Converted Bearer token to Basic auth for user: {username}")
                 else:
                     # Single token - try as Bearer
@@ -2219,10 +2538,8 @@ async def proxy_image(request):
         elif auth_token:
             if ':' in auth_token:
                 # Token in username:password format
-                username, password = auth_token.split(':', 1)
-                import base64
-                credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
-                headers["Authorization"] = f"Basic {credentials}"
+                username = auth_token.split(':', 1)[0]
+                headers["Authorization"] = _basic_auth_header(auth_token)
                 logger.info(f"Using token credentials for user: {username}")
             else:
                 # Single token - try as Bearer
@@ -2231,36 +2548,106 @@ async def proxy_image(request):
         else:
             logger.warning("No authentication provided - attempting to fetch public image")
 
-        # Fetch the image (follow redirects like curl -L)
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            response = await client.get(url, headers=headers, timeout=30.0)
+        # Images fetched with the same credentials in the last hour are served from memory
+        cache_key = (url, hashlib.sha256(headers.get("Authorization", "").encode()).digest())
+        cached_response = _cached_image_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # If the same image is already being fetched, wait for that fetch to cache it. Images too
+        # large to cache, failed fetches and stalled ones fall through to a fetch of our own.
+        inflight = _PROXY_INFLIGHT.get(cache_key)
+        if inflight is not None:
+            try:
+                await asyncio.wait_for(inflight.wait(), timeout=_PROXY_INFLIGHT_WAIT)
+            except asyncio.TimeoutError:
+                if _PROXY_INFLIGHT.get(cache_key) is inflight:
+                    del _PROXY_INFLIGHT[cache_key]
+            cached_response = _cached_image_response(cache_key)
+            if cached_response is not None:
+                return cached_response
+
+        done = asyncio.Event()
+        _PROXY_INFLIGHT[cache_key] = done
+
+        def finish_fetch():
+            if _PROXY_INFLIGHT.get(cache_key) is done:
+                del _PROXY_INFLIGHT[cache_key]
+            done.set()
+
+        # Fetch the image (follow redirects like curl -L). The body is streamed through to the
+        # caller, so the upstream response stays open until it has been fully sent.
+        try:
+            response = await _send_proxy_request(url, headers)
+        except BaseException:
+            finish_fetch()
+            raise
+
+        if response.is_error:
+            finish_fetch()
+            # Read the error body so the handlers below can include it in their detail
+            await response.aread()
+            await response.aclose()
             response.raise_for_status()
 
-            # Get content type from response, but fix it for images
-            content_type = response.headers.get("content-type", "application/octet-stream")
-
-            # If Sage returns generic octet-stream but URL suggests it's an image, fix the content type
-            if content_type == "application/octet-stream" and url.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.webp')):
-                if url.lower().endswith(('.jpg', '.jpeg')):
-                    content_type = "image/jpeg"
-                elif url.lower().endswith('.png'):
-                    content_type = "image/png"
-                elif url.lower().endswith('.gif'):
-                    content_type = "image/gif"
-                elif url.lower().endswith('.webp'):
-                    content_type = "image/webp"
-
-
-            # Return the image data
-            return Response(
-                content=response.content,
-                media_type=content_type,
-                headers={
-                    "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
-                    "X-Sage-Proxy": "true"
-                }
-            )
+        # Get content type from response, but fix it for images
+        content_type = response.headers.get("content-type", "application/octet-stream")
+
+        # If Sage returns generic octet-stream but URL suggests it's an image, fix the content type
+        if content_type == "application/octet-stream":
+            ext = _IMAGE_EXT_RE.search(url)
+            if ext:
+                content_type = _IMAGE_EXT_MIME[ext.group(1).lower()]
+
+        # Refuse oversized or non-image objects before any of the body is read; Sage storage labels
+        # many images application/octet-stream, so that type is still let through
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > _PROXY_MAX_BYTES:
+            finish_fetch()
+            await response.aclose()
+            raise HTTPException(status_code=413, detail=f"Upstream object is too large ({content_length} bytes, limit {_PROXY_MAX_BYTES})")
+        if not content_type.startswith(("image/", "application/octet-stream")):
+            finish_fetch()
+            await response.aclose()
+            raise HTTPException(status_code=415, detail=f"Upstream object is not an image ({content_type})")
+
+        async def forward_body():
+            # Forward the image data in chunks as it arrives, keeping a copy of small images
+            # so a completely sent body can be cached
+            chunks, size = [], 0
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    size += len(chunk)
+                    if size > _PROXY_MAX_BYTES:
+                        # Chunked or unlabelled bodies get past the Content-Length check, so the limit
+                        # is enforced on the bytes actually read; the status is already sent, so the
+                        # stream is aborted rather than ended cleanly
+                        await response.aclose()
+                        logger.warning(f"Aborting proxied image over {_PROXY_MAX_BYTES} bytes: {url}")
+                        raise RuntimeError(f"Upstream object exceeded {_PROXY_MAX_BYTES} bytes")
+                    if chunks is not None:
+                        if size <= _PROXY_CACHE_MAX_BYTES:
+                            chunks.append(chunk)
+                        else:
+                            chunks = None
+                    yield chunk
+                if chunks is not None:
+                    _PROXY_IMAGE_CACHE.set(cache_key, (b"".join(chunks), content_type))
+            finally:
+                finish_fetch()
+
+        return StreamingResponse(
+            forward_body(),
+            media_type=content_type,
+            headers={
+                "Cache-Control": "public, max-age=3600",  # Cache for 1 hour
+                "X-Sage-Proxy": "true"
+            },
+            background=BackgroundTask(response.aclose)
+        )
 
+    except HTTPException:
+        raise
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 401:
             raise HTTPException(status_code=401, detail=f"Authentication required or invalid credentials. Sage response: {e.response.text}")
@@ -2429,16 +2816,13 @@ def troubleshooting_guide() -> str:
 # 8. STARTUP AND SERVER ENTRY
 # ----------------------------------------
 
-# Initialize the documentation helper
-docs_helper = SAGEDocsHelper()
-
 async def print_registered() -> None:
     """Print registered components for debugging"""
     try:
-        # Get server capabilities
-        tools = await mcp.list_tools()
-        resources = await mcp.list_resources()
-        prompts = await mcp.list_prompts()
+        # Get server capabilities; the three listings are independent, so fetch them concurrently
+        tools, resources, prompts = await asyncio.gather(
+            mcp.list_tools(), mcp.list_resources(), mcp.list_prompts()
+        )
 
         print("\n" + "="*50)
         print("SageDataMCP Server Starting...")
@@ -2467,17 +2851,18 @@ def test_sage_connection() -> bool:
     try:
         logger.info("Testing sage_data_client connection...")
         test_df = sage_data_client.query(start="-5m", filter={"name": "env.temperature"})
-        logger.info(f"sage_data_client working - found {len(test_df)} recent temperature records")
+        logger.info("sage_data_client working - found %d recent temperature records", len(test_df))
         return True
     except Exception as e:
-        logger.warning(f"WARNING: sage_data_client test failed: {e}")
+        logger.warning("WARNING: sage_data_client test failed: %s", e)
         logger.warning("Server will start but temperature queries may fail")
         return False
 
 def main() -> None:
     """Main entry point"""
-    # Test sage_data_client availability
-    test_sage_connection()
+    # Test sage_data_client availability in the background so the server binds without waiting on it;
+    # the probe only logs its outcome
+    threading.Thread(target=test_sage_connection, name="sage-connection-test", daemon=True).start()
 
     # Print registration info
     try:
@@ -2511,6 +2896,12 @@ def main() -> None:
     except Exception as e:
         logger.error(f"Server error: {e}")
         sys.exit(1)
+    finally:
+        # Release pooled image proxy connections; the server's event loop is gone by now
+        try:
+            asyncio.run(_PROXY_CLIENT.aclose())
+        except Exception as e:
+            logger.debug(f"Error closing image proxy client: {e}")
 
 
 
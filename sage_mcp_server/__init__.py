@@ -11,12 +11,12 @@ from .models import (
 )
 
 # Utility functions
-from .utils import safe_timestamp_format, parse_time_range
+from .utils import safe_timestamp_format, parse_time_range, TTLCache
 
 # Core services
 from .data_service import SageDataService
 from .job_service import SageJobService
-from .docs_helper import SAGEDocsHelper
+from .docs_helper import SAGEDocsHelper, get_docs_helper
 
 # Plugin system
 from .plugin_metadata import plugin_registry
@@ -32,9 +32,9 @@ __all__ = [
     "SageConfig", "TimeRange", "NodeID", "DataType", "SelectorRequirements",
     "PluginArguments", "PluginSpec", "SageJob", "CameraSageJob",
     # Utils
-    "safe_timestamp_format", "parse_time_range",
+    "safe_timestamp_format", "parse_time_range", "TTLCache",
     # Services
-    "SageDataService", "SageJobService", "SAGEDocsHelper",
+    "SageDataService", "SageJobService", "SAGEDocsHelper", "get_docs_helper",
     # Plugin system
     "plugin_registry", "plugin_query_service", "PluginTemplate",
     "PluginRequirements", "PluginGenerator",
@@ -1,13 +1,107 @@
+import asyncio
+import calendar
 import pandas as pd
+import threading
+import time
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional, Tuple, Union
 from .models import TimeRange, NodeID, DataType
-from .utils import safe_timestamp_format, parse_time_range
+from .utils import safe_timestamp_format, parse_time_range, TTLCache
 import logging
 import sage_data_client
 import os
 
 logger = logging.getLogger(__name__)
 
+# Upstream queries currently running, keyed by their arguments, so identical concurrent
+# requests share one call to the Sage data API instead of each issuing their own
+_INFLIGHT_QUERIES: Dict[Tuple[Any, ...], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Recent raw query results; tools re-issue the same queries often and a short TTL keeps data fresh.
+# Frames are weighed by their memory footprint so a few large results can't pin unbounded RAM
+_QUERY_CACHE_TTL = 30
+_QUERY_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+_QUERY_CACHE = TTLCache(
+    maxsize=32, ttl=_QUERY_CACHE_TTL,
+    maxweight=_QUERY_CACHE_BUDGET_BYTES, weigh=lambda df: int(df.memory_usage(deep=True).sum()),
+)
+
+# Guidance logged with a failed query, emitted as one record instead of one call per line
+_TIMEOUT_HELP = "\n".join([
+    "Query timed out - try reducing the time range or being more specific with filters",
+    "Suggestions: Use shorter time periods (e.g., -5m instead of -30m) or filter by specific nodes",
+])
+_AUTH_HELP = "\n".join([
+    "Authentication failed. Please check your token and permissions.",
+    "For protected data access, you need:",
+    "1. A valid Sage account",
+    "2. Signed Data Use Agreement",
+    "3. Valid access token from https://portal.sagecontinuum.org/account/access",
+    "4. Token format: 'username:token' or just 'token'",
+])
+
+# Static query filters, built once rather than on every call
+_CLOUD_PLUGIN_FILTER = "|".join([
+    ".*cloud-cover.*",
+    ".*cloud-motion.*",
+    ".*imagesampler.*"
+])
+_ENVIRONMENTAL_NAME_FILTER = "|".join(DataType.environmental_types())
+
+def _cache_bounds(start: str, end: Optional[str]) -> Tuple[Any, Any]:
+    """Cache key form of a query window.
+
+    Relative ranges like "-15m" resolve to a new start/end every second, so a window ending
+    within the cache TTL of now is floored to TTL-sized buckets; a cached entry for it is then
+    at most a TTL stale. Any other window, such as an explicit historical range, is keyed on
+    its exact bounds so it never shares an entry with a different window.
+    """
+    try:
+        start_epoch = calendar.timegm(time.strptime(start, '%Y-%m-%dT%H:%M:%SZ'))
+        end_epoch = calendar.timegm(time.strptime(end, '%Y-%m-%dT%H:%M:%SZ'))
+    except (TypeError, ValueError):
+        return start, end
+    if not 0 <= time.time() - end_epoch < _QUERY_CACHE_TTL:
+        return start, end
+    return start_epoch // _QUERY_CACHE_TTL, end_epoch // _QUERY_CACHE_TTL
+
+def _coalesced_query(query_args: Dict[str, Any]) -> pd.DataFrame:
+    """Run sage_data_client.query, reusing a recent result or joining an identical query in flight"""
+    key = (
+        *_cache_bounds(query_args["start"], query_args.get("end")),
+        tuple(sorted(query_args["filter"].items())),
+    )
+    # Results are shallow copies sharing data with the cached frame: callers may assign new
+    # columns, but must not change existing values in place
+    cached = _QUERY_CACHE.get(key)
+    if cached is not None:
+        logger.info("Using cached Sage query result")
+        return cached.copy(deep=False)
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT_QUERIES.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT_QUERIES[key] = Future()
+
+    if not leader:
+        logger.info("Joining identical in-flight Sage query")
+        return future.result().copy(deep=False)
+
+    try:
+        df = sage_data_client.query(**query_args)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        _QUERY_CACHE.set(key, df)
+        future.set_result(df)
+        return df.copy(deep=False)
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT_QUERIES.pop(key, None)
+
 class SageDataService:
     """Service for interacting with Sage data client"""
 
@@ -17,17 +111,14 @@ class SageDataService:
         end: Optional[str] = None,
         filter_params: Optional[Dict[str, Any]] = None,
         user_token: Optional[str] = None,
-        max_records: int = 1000
+        max_records: int = 1000,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
+        """Query Sage data between ISO8601 ``start`` and ``end``, as returned by parse_time_range"""
         try:
+            # No vsn selector means all nodes; a "*" wildcard only added a match-everything predicate
             if filter_params is None:
                 filter_params = {}
-            if "vsn" not in filter_params:
-                filter_params["vsn"] = "*"
-            if isinstance(start, TimeRange):
-                start, end = parse_time_range(start)
-            elif isinstance(start, str) and not ('T' in start and 'Z' in start):
-                start, end = parse_time_range(start)
 
             query_args = {"start": start, "filter": filter_params}
             if end:
@@ -39,50 +130,63 @@ class SageDataService:
             if user_token:
                 if ':' in user_token:
                     username, _ = user_token.split(':', 1)
-                    logger.info(f"User token provided (username: {username}) - attempting query")
+                    logger.info("User token provided (username: %s) - attempting query", username)
                     logger.warning("sage_data_client authentication not yet implemented - may only return public data")
                 else:
-                    logger.warning(f"Token provided without username. For protected data access, use 'username:token' format")
-                    logger.info(f"Attempting query with simple token - may only return public data")
+                    logger.warning("Token provided without username. For protected data access, use 'username:token' format")
+                    logger.info("Attempting query with simple token - may only return public data")
             else:
-                logger.info(f"Querying Sage data without authentication (public data only)")
+                logger.info("Querying Sage data without authentication (public data only)")
 
             # Add timeout warning for large queries
-            logger.info(f"Executing Sage query with parameters: {query_args} (max_records: {max_records})")
+            logger.info("Executing Sage query with parameters: %s (max_records: %d)", query_args, max_records)
 
-            df = sage_data_client.query(**query_args)
+            df = _coalesced_query(query_args)
             original_count = len(df)
-            logger.info(f"Query returned {original_count:,} records")
+            logger.info("Query returned %d records", original_count)
+
+            # The query API always returns every field, so unneeded columns are dropped as early as possible
+            if columns is not None:
+                df = df.drop(columns=[c for c in df.columns if c not in columns])
 
             # Limit result size to prevent overwhelming responses and timeouts
             if len(df) > max_records:
-                logger.warning(f"Large result set ({original_count:,} records) - limiting to {max_records:,} most recent")
-                # Sort by timestamp descending and keep most recent
-                df = df.sort_values('timestamp', ascending=False).head(max_records)
+                logger.warning("Large result set (%d records) - limiting to %d most recent", original_count, max_records)
+                # Keep the most recent, newest first; a partial selection avoids sorting every record
+                df = df.nlargest(max_records, 'timestamp')
                 # Reset index after slicing to avoid issues downstream
                 df = df.reset_index(drop=True)
 
             return df
         except Exception as e:
             error_str = str(e)
-            logger.error(f"Error querying Sage data: {error_str}")
+            logger.error("Error querying Sage data: %s", error_str)
 
             # Handle different types of errors with specific guidance
             if "timeout" in error_str.lower() or "504" in error_str:
-                logger.error("Query timed out - try reducing the time range or being more specific with filters")
-                logger.error("Suggestions: Use shorter time periods (e.g., -5m instead of -30m) or filter by specific nodes")
+                logger.error(_TIMEOUT_HELP)
             elif user_token and ("401" in error_str or "Unauthorized" in error_str or "auth" in error_str.lower()):
-                logger.error("Authentication failed. Please check your token and permissions.")
-                logger.error("For protected data access, you need:")
-                logger.error("1. A valid Sage account")
-                logger.error("2. Signed Data Use Agreement")
-                logger.error("3. Valid access token from https://portal.sagecontinuum.org/account/access")
-                logger.error("4. Token format: 'username:token' or just 'token'")
+                logger.error(_AUTH_HELP)
             elif "500" in error_str or "502" in error_str or "503" in error_str:
                 logger.error("Sage service temporarily unavailable - try again in a few moments")
 
             return pd.DataFrame()
 
+    @staticmethod
+    async def query_data_async(
+        start: str,
+        end: Optional[str] = None,
+        filter_params: Optional[Dict[str, Any]] = None,
+        user_token: Optional[str] = None,
+        max_records: int = 1000,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Run query_data on a worker thread so the event loop isn't blocked by the upstream request"""
+        return await asyncio.to_thread(
+            SageDataService.query_data, start, end, filter_params,
+            user_token=user_token, max_records=max_records, columns=columns
+        )
+
     @staticmethod
     def query_plugin_data(
         plugin: str,
@@ -117,17 +221,8 @@ class SageDataService:
         user_token: Optional[str] = None
     ) -> pd.DataFrame:
         """Query cloud-related data from SAGE"""
-        # Define cloud-related plugins
-        cloud_plugins = [
-            ".*cloud-cover.*",
-            ".*cloud-motion.*",
-            ".*imagesampler.*"
-        ]
-
         start, end = parse_time_range(time_range)
-        filter_params = {
-            "plugin": '|'.join(cloud_plugins)
-        }
+        filter_params = {"plugin": _CLOUD_PLUGIN_FILTER}
 
         if node_id:
             filter_params["vsn"] = str(node_id)
@@ -152,13 +247,14 @@ class SageDataService:
     def query_environmental_data(
         node_id: Optional[Union[str, NodeID]] = None,
         time_range: Union[str, TimeRange] = "-30m",  # Reduced default
-        user_token: Optional[str] = None
+        user_token: Optional[str] = None,
+        max_records: int = 1000
     ) -> pd.DataFrame:
         start, end = parse_time_range(time_range)
-        filter_params = {"name": "|".join(DataType.environmental_types())}
+        filter_params = {"name": _ENVIRONMENTAL_NAME_FILTER}
         if node_id:
             filter_params["vsn"] = str(node_id)
-        return SageDataService.query_data(start, end, filter_params, user_token=user_token)
+        return SageDataService.query_data(start, end, filter_params, user_token=user_token, max_records=max_records)
 
     @staticmethod
     def query_job_data(
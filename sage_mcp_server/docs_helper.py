@@ -1,10 +1,21 @@
+import functools
+import io
 import re
+import sys
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+_SECTION_RE = re.compile(r'\n(#{1,2})\s+(.+)')
+_WORD_RE = re.compile(r'\w+')
+
 class SAGEDocsHelper:
     """Helper class for searching and answering questions from Sage documentation"""
 
@@ -12,7 +23,19 @@ class SAGEDocsHelper:
         self.docs_file_path = docs_file_path
         self.docs_content = ""
         self.sections = {}
+        self._vocab: Dict[str, int] = {}
+        self.section_preview: Dict[str, str] = {}
+        self._section_names: List[str] = []
+        self._names_lower: List[str] = []
+        self._contents_lower: List[str] = []
+        self._dtm = np.zeros((0, 0), dtype=np.float32)
         self.faqs = {}
+        self._faq_topic_tokens = {}
+        self._faq_rendered: Dict[str, str] = {}
+        self._faq_topics_csv = ""
+        self._faq_topics_listing = ""
+        # Ranked results per (lowercased query, max_results); ranking is case-insensitive
+        self._search_cache = TTLCache(maxsize=512, ttl=600)
         self._load_documentation()
         self._setup_faqs()
 
@@ -32,7 +55,7 @@ class SAGEDocsHelper:
     def _parse_sections(self):
         if not self.docs_content:
             return
-        sections = re.split(r'\n(#{1,2})\s+(.+)', self.docs_content)
+        sections = _SECTION_RE.split(self.docs_content)
         current_section = ""
         current_content = ""
         for i in range(0, len(sections), 3):
@@ -49,66 +72,118 @@ class SAGEDocsHelper:
                     current_content += content
         if current_section:
             self.sections[current_section] = current_content
+        self._build_index()
+
+    def _build_index(self):
+        """Tokenize every section once into a (section x term) frequency matrix"""
+        self._vocab = {}
+        # The corpus never changes after loading, so casefold it once rather than per query
+        self._section_names = list(self.sections)
+        self._names_lower = [name.lower() for name in self._section_names]
+        self._contents_lower = [content.lower() for content in self.sections.values()]
+        self.section_preview = {
+            name: (content[:500] + "...") if len(content) > 500 else content
+            for name, content in self.sections.items()
+        }
+        rows = []
+        for content_lower in self._contents_lower:
+            counts: Dict[int, int] = {}
+            for word in _WORD_RE.findall(content_lower):
+                col = self._vocab.setdefault(word, len(self._vocab))
+                counts[col] = counts.get(col, 0) + 1
+            rows.append(counts)
+        self._dtm = np.zeros((len(rows), len(self._vocab)), dtype=np.float32)
+        for i, counts in enumerate(rows):
+            self._dtm[i, list(counts.keys())] = list(counts.values())
 
     def _setup_faqs(self):
         self.faqs = {
             # ... (copy FAQ dict from sage_mcp.py) ...
         }
+        # Pre-split topic keys so search_and_answer doesn't re-split per call
+        self._faq_topic_tokens = {k: tuple(sys.intern(t) for t in k.split('_')) for k in self.faqs}
+        self._faq_rendered = {k: f"**{v['question']}**\n\n{v['answer']}" for k, v in self.faqs.items()}
+        self._faq_topics_csv = ", ".join(self.faqs.keys())
+        self._faq_topics_listing = "Available FAQ topics:\n" + "\n".join(f"- {topic}" for topic in self.faqs)
 
     def search_docs(self, query: str, max_results: int = 3) -> List[Tuple[str, str, float]]:
         if not self.docs_content:
             return []
         query_lower = query.lower()
-        query_words = re.findall(r'\w+', query_lower)
-        results = []
-        for section_name, content in self.sections.items():
-            content_lower = content.lower()
-            score = 0
-            if query_lower in content_lower:
-                score += 100
-            for word in query_words:
-                if word in content_lower:
-                    score += 10
-                if word in section_name.lower():
-                    score += 20
-            if any(word in section_name.lower() for word in query_words):
-                score += 50
-            if score > 0:
-                preview = content[:500] + "..." if len(content) > 500 else content
-                results.append((section_name, preview, score))
-        results.sort(key=lambda x: x[2], reverse=True)
-        return results[:max_results]
+        key = (query_lower, max_results)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = self._rank_sections(query_lower, max_results)
+            self._search_cache.set(key, results)
+        # Hand out a copy so callers can't alter the cached ranking
+        return list(results)
+
+    def _rank_sections(self, query_lower: str, max_results: int) -> List[Tuple[str, str, float]]:
+        query_words = _WORD_RE.findall(query_lower)
+        # Repeated query words are weighted by their count instead of being rescanned
+        q_counter = Counter(query_words)
+        # +10 for every query word found in a section, scored across all sections in one product.
+        # A query word is a run of word characters, so it occurs in a section's text exactly when
+        # it is a substring of one of its terms; "node" still matches text that only says "nodes"
+        hits = np.zeros((len(self._section_names), len(q_counter)), dtype=np.float32)
+        for j, word in enumerate(q_counter):
+            cols = [col for term, col in self._vocab.items() if word in term]
+            if cols:
+                hits[:, j] = self._dtm[:, cols].any(axis=1)
+        scores = hits @ np.array([10 * cnt for cnt in q_counter.values()], dtype=np.float32)
+        section_names = self._section_names
+        for i, name_lower in enumerate(self._names_lower):
+            if query_lower in self._contents_lower[i]:
+                scores[i] += 100
+            # Substring matches, so "node" still credits a section named "Nodes"
+            scores[i] += 20 * sum(cnt for word, cnt in q_counter.items() if word in name_lower)
+            if any(word in name_lower for word in q_counter):
+                scores[i] += 50
+        candidates = np.flatnonzero(scores > 0)
+        if max_results <= 0 or not candidates.size:
+            return []
+        if len(candidates) > max_results:
+            # Partial selection: keep everything tied with the k-th best score, then order just those
+            kth = np.partition(scores[candidates], -max_results)[-max_results]
+            candidates = candidates[scores[candidates] >= kth]
+        top = candidates[np.lexsort((candidates, -scores[candidates]))][:max_results]
+        return [
+            (section_names[i], self.section_preview[section_names[i]], round(float(scores[i]), 2))
+            for i in top
+        ]
 
     def get_faq_answer(self, topic: str) -> str:
-        if topic.lower() in self.faqs:
-            faq = self.faqs[topic.lower()]
-            return f"**{faq['question']}**\n\n{faq['answer']}"
-        return ""
+        return self._faq_rendered.get(topic.lower(), "")
 
     def list_faq_topics(self) -> str:
-        topics = list(self.faqs.keys())
-        return "Available FAQ topics:\n" + "\n".join(f"- {topic}" for topic in topics)
+        return self._faq_topics_listing
 
     def search_and_answer(self, question: str) -> str:
         question_lower = question.lower()
         faq_matches = []
-        for topic, faq in self.faqs.items():
-            if any(word in question_lower for word in topic.split('_')):
+        for topic, tokens in self._faq_topic_tokens.items():
+            if any(word in question_lower for word in tokens):
                 faq_matches.append(topic)
-        response_parts = []
+        buf = io.StringIO()
         if faq_matches:
-            response_parts.append("## Quick Answer (FAQ):")
+            buf.write("## Quick Answer (FAQ):\n")
             for topic in faq_matches[:2]:
-                response_parts.append(self.get_faq_answer(topic))
-                response_parts.append("")
+                buf.write(self.get_faq_answer(topic))
+                buf.write("\n\n")
         search_results = self.search_docs(question)
         if search_results:
-            response_parts.append("## Additional Documentation:")
+            buf.write("## Additional Documentation:\n")
             for i, (section, content, score) in enumerate(search_results, 1):
-                response_parts.append(f"**{i}. {section}**")
-                response_parts.append(content)
-                response_parts.append("")
-        if not response_parts:
-            return f"I couldn't find specific information about '{question}' in the documentation. " + \
-                   f"Try asking about: {', '.join(self.faqs.keys())} or contact us for help."
-        return "\n".join(response_parts)
\ No newline at end of file
+                buf.write(f"**{i}. {section}**\n")
+                buf.write(content)
+                buf.write("\n\n")
+        if not buf.tell():
+            return (f"I couldn't find specific information about '{question}' in the documentation. "
+                    f"Try asking about: {self._faq_topics_csv} or contact us for help.")
+        return buf.getvalue()
+
+
+@functools.cache
+def get_docs_helper() -> SAGEDocsHelper:
+    """Return the shared docs helper, loading the documentation on first use"""
+    return SAGEDocsHelper()
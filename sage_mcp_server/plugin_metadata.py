@@ -1,16 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Any
 from datetime import datetime
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, Field
 
+# orjson is an optional, much faster JSON decoder; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 SAGE_PLUGINS_URL = "https://ecr.sagecontinuum.org/api/apps"
 ECR_META_FILES_URL = "https://ecr.sagecontinuum.org/api/meta-files"
 
+# One pooled session for all ECR requests, so the app listing and the science
+# description fetches reuse TLS connections instead of opening one per request
+_ECR_SESSION = requests.Session()
+_ECR_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False),
+))
+
 class PluginInput(BaseModel):
     """Model for plugin input parameters"""
     id: str
@@ -106,7 +125,7 @@ class PluginRegistry:
             url = f"{ECR_META_FILES_URL}/{science_description_path}"
             logger.info(f"Fetching science description from: {url}")
 
-            response = requests.get(url, timeout=10)
+            response = _ECR_SESSION.get(url, timeout=(3.05, 10))
             if response.status_code == 200:
                 content = response.text
                 # Cache the content
@@ -124,11 +143,12 @@ class PluginRegistry:
         """Refresh the plugin metadata cache from the Sage API"""
         try:
             logger.info(f"Fetching plugins from {SAGE_PLUGINS_URL}")
-            response = requests.get(SAGE_PLUGINS_URL, timeout=30)
+            response = _ECR_SESSION.get(SAGE_PLUGINS_URL, timeout=(3.05, 30))
             if response.status_code == 200:
-                plugins_data = response.json().get("data", [])
+                plugins_data = _json_loads(response.content).get("data", [])
                 logger.info(f"Found {len(plugins_data)} plugins in ECR")
 
+                described_plugins = []
                 for plugin_data in plugins_data:
                     try:
                         # Parse basic plugin metadata with proper None handling
@@ -165,20 +185,25 @@ class PluginRegistry:
                                 url=source_data.get("url") or ""
                             )
 
-                        # Fetch science description content if available
-                        if plugin.science_description:
-                            plugin.science_description_content = self._fetch_science_description(
-                                plugin.science_description
-                            )
-
                         if plugin.id:  # Only add if we have a valid ID
                             self.plugins[plugin.id] = plugin
                             logger.debug(f"Cached plugin: {plugin.id}")
+                            if plugin.science_description:
+                                described_plugins.append(plugin)
 
                     except Exception as e:
                         logger.warning(f"Error parsing plugin data: {e}")
                         continue
 
+                # Fetch all science descriptions concurrently over the pooled session
+                # instead of one blocking request per plugin
+                paths = list({plugin.science_description for plugin in described_plugins})
+                if paths:
+                    with ThreadPoolExecutor(max_workers=min(len(paths), 16)) as executor:
+                        contents = dict(zip(paths, executor.map(self._fetch_science_description, paths)))
+                    for plugin in described_plugins:
+                        plugin.science_description_content = contents[plugin.science_description]
+
                 logger.info(f"Successfully cached {len(self.plugins)} plugins with science descriptions")
             else:
                 logger.error(f"Failed to fetch plugins: {response.status_code}")
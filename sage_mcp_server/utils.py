@@ -1,6 +1,11 @@
 import pandas as pd
+from collections import OrderedDict
+import functools
 from datetime import datetime, timedelta
+from typing import Any, Callable, Hashable, Optional, Tuple
 import re
+import threading
+import time
 
 def safe_timestamp_format(timestamp) -> str:
     """Safely format a timestamp to ISO8601 string"""
@@ -13,10 +18,17 @@ def safe_timestamp_format(timestamp) -> str:
     except Exception as e:
         return str(timestamp)
 
+_RELATIVE_RANGE_RE = re.compile(r'-(\d+)([hm])')
+
 def parse_time_range(time_range) -> tuple[str, str]:
     """Return (start, end) as ISO8601 strings. If time_range is ISO, use as start and add 1h for end. If relative, convert to ISO."""
     if hasattr(time_range, 'value'):
         time_range = str(time_range)
+    # Results only have second resolution, so keying on the current second keeps cached values exact
+    return _parse_time_range_at(time_range, int(time.time()))
+
+@functools.lru_cache(maxsize=64)
+def _parse_time_range_at(time_range: str, now_second: int) -> tuple[str, str]:
     if 'T' in time_range and 'Z' in time_range:
         try:
             start_time = datetime.strptime(time_range, '%Y-%m-%dT%H:%M:%SZ')
@@ -27,8 +39,8 @@ def parse_time_range(time_range) -> tuple[str, str]:
             )
         except Exception:
             return time_range, ""
-    match = re.match(r'-(\d+)([hm])', time_range)
-    now = datetime.utcnow()
+    match = _RELATIVE_RANGE_RE.match(time_range)
+    now = datetime.utcfromtimestamp(now_second)
     if match:
         amount = int(match.group(1))
         unit = match.group(2)
@@ -39,4 +51,66 @@ def parse_time_range(time_range) -> tuple[str, str]:
         start = (now - delta).strftime('%Y-%m-%dT%H:%M:%SZ')
         end = now.strftime('%Y-%m-%dT%H:%M:%SZ')
         return start, end
-    return time_range, "" 
\ No newline at end of file
+    return time_range, "" 
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire ``ttl`` seconds after being stored.
+
+    Besides ``maxsize`` entries, the cache can be bounded by total weight: pass ``weigh`` to size
+    each value (e.g. its length in bytes) and ``maxweight`` for the budget. Least recently used
+    entries are evicted until both limits hold; a value heavier than the whole budget isn't stored.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0,
+                 maxweight: Optional[int] = None, weigh: Optional[Callable[[Any], int]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self._weight = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def weight(self) -> int:
+        """Total weight of the stored values (0 unless ``weigh`` is set)"""
+        return self._weight
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires, value, weight = item
+            if time.monotonic() >= expires:
+                del self._data[key]
+                self._weight -= weight
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        weight = self._weigh(value) if self._weigh is not None else 0
+        with self._lock:
+            now = time.monotonic()
+            # Drop expired entries first so values nobody reads again don't outlive their TTL.
+            # Reads reorder entries by recency, not expiry, so every entry is checked
+            for stale in [k for k, (expires, _, _) in self._data.items() if now >= expires]:
+                self._weight -= self._data.pop(stale)[2]
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._weight -= old[2]
+            if self.maxweight is not None and weight > self.maxweight:
+                return
+            self._data[key] = (now + self.ttl, value, weight)
+            self._weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self._weight > self.maxweight
+            ):
+                _, (_, _, evicted) = self._data.popitem(last=False)
+                self._weight -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
@@ -0,0 +1,25 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def sage_mcp():
+    """Import the server module, supplying the analytics service it imports if the package lacks one"""
+    import sage_mcp_server
+
+    if not hasattr(sage_mcp_server, "AnalyticsService"):
+        sage_mcp_server.AnalyticsService = object
+        sage_mcp_server.get_analytics_service = lambda: None
+    return importlib.import_module("sage_mcp")
+
+
+def tool_fn(tool):
+    """The plain function behind an @mcp.tool() registration"""
+    return getattr(tool, "fn", tool)
@@ -0,0 +1,81 @@
+from sage_mcp_server.docs_helper import SAGEDocsHelper
+
+DOCS = """Introduction to the platform.
+
+# Nodes
+Hardware deployed in the field.
+
+# Publishing our app
+Push the image to the registry.
+
+# Accessing development nodes
+Use ssh through the bastion.
+
+# Miscellaneous
+Other things.
+"""
+
+
+def _helper(tmp_path):
+    path = tmp_path / "llms.md"
+    path.write_text(DOCS, encoding="utf-8")
+    return SAGEDocsHelper(docs_file_path=str(path))
+
+
+def test_section_name_bonus_matches_substrings(tmp_path):
+    helper = _helper(tmp_path)
+
+    # "node" is a substring of "nodes": +20 per matching word and +50 for any match; ties keep document order
+    results = helper.search_docs("node", max_results=5)
+    assert [(name, score) for name, _, score in results] == [
+        ("Nodes", 70.0),
+        ("Accessing development nodes", 70.0),
+    ]
+
+    results = helper.search_docs("publish", max_results=5)
+    assert [(name, score) for name, _, score in results] == [("Publishing our app", 70.0)]
+
+
+def test_body_matches_score_a_flat_ten_per_query_word(tmp_path):
+    helper = _helper(tmp_path)
+
+    # +100 for the whole query in the text and +10 for its one word, with no per-word weighting
+    results = helper.search_docs("hardware", max_results=5)
+    assert [(name, score) for name, _, score in results] == [("Publishing our app", 110.0)]
+
+    # A word shared by several sections counts as much as a rare one
+    results = helper.search_docs("the bastion", max_results=5)
+    assert [(name, score) for name, _, score in results] == [
+        ("Miscellaneous", 120.0),
+        ("Nodes", 10.0),
+        ("Publishing our app", 10.0),
+        ("Accessing development nodes", 10.0),
+    ]
+
+
+def test_body_text_matches_substrings(tmp_path):
+    # "node" only appears inside "nodes", in the text read with the "End" section
+    path = tmp_path / "plural.md"
+    path.write_text("Intro.\n# Fleet\nAll nodes report hourly.\n# End\nDone.\n", encoding="utf-8")
+    helper = SAGEDocsHelper(docs_file_path=str(path))
+
+    results = helper.search_docs("node", max_results=5)
+    assert [(name, score) for name, _, score in results] == [("End", 110.0)]
+
+
+def test_search_is_case_insensitive_and_cached(tmp_path):
+    helper = _helper(tmp_path)
+
+    assert helper.search_docs("NODE", max_results=5) == helper.search_docs("node", max_results=5)
+    assert helper.search_docs("zzz-not-present") == []
+
+
+def test_changing_returned_results_does_not_affect_the_cache(tmp_path):
+    helper = _helper(tmp_path)
+
+    results = helper.search_docs("node", max_results=5)
+    expected = list(results)
+    results.reverse()
+    results.append(("Injected", "", 999.0))
+
+    assert helper.search_docs("node", max_results=5) == expected
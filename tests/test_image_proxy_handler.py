@@ -0,0 +1,157 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.exceptions import HTTPException
+
+IMAGE_URL = "https://storage.sagecontinuum.org/api/v1/data/node/sample.jpg"
+
+
+class _Request:
+    def __init__(self, url, auth=None):
+        self.query_params = {"url": url}
+        self.headers = {"Authorization": auth} if auth else {}
+
+
+async def _read(response):
+    """Body of a proxy response, running its background task the way Starlette would"""
+    if hasattr(response, "body_iterator"):
+        chunks = [chunk async for chunk in response.body_iterator]
+        if response.background:
+            await response.background()
+        return b"".join(chunks)
+    return response.body
+
+
+@pytest.fixture
+def upstream(sage_mcp, monkeypatch):
+    """Route the proxy's client through a mock transport; tests set .handler and read .calls"""
+    class Upstream:
+        calls = []
+
+        @staticmethod
+        def handler(request):
+            return httpx.Response(200, content=b"jpeg-bytes", headers={"content-type": "image/jpeg"})
+
+    async def dispatch(request):
+        Upstream.calls.append(str(request.url))
+        result = Upstream.handler(request)
+        return await result if asyncio.iscoroutine(result) else result
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch), follow_redirects=True)
+    monkeypatch.setattr(sage_mcp, "_PROXY_CLIENT", client)
+    monkeypatch.setattr(sage_mcp, "_PROXY_HEDGE_DELAY", 0)
+    sage_mcp._PROXY_IMAGE_CACHE.clear()
+    yield Upstream
+    sage_mcp._PROXY_IMAGE_CACHE.clear()
+    assert sage_mcp._PROXY_INFLIGHT == {}
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_served_from_cache(sage_mcp, upstream):
+    first = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+    assert await _read(first) == b"jpeg-bytes"
+    assert first.headers["x-sage-proxy"] == "true"
+
+    second = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+    assert await _read(second) == b"jpeg-bytes"
+    assert second.headers["x-sage-proxy"] == "hit"
+    assert second.media_type == "image/jpeg"
+    assert len(upstream.calls) == 1
+
+    # Different credentials never share a cache entry
+    other = await sage_mcp.proxy_image(_Request(IMAGE_URL, auth="Bearer someone-else"))
+    assert await _read(other) == b"jpeg-bytes"
+    assert len(upstream.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_oversized_object_is_refused(sage_mcp, upstream):
+    too_large = str(sage_mcp._PROXY_MAX_BYTES + 1)
+    upstream.handler = lambda request: httpx.Response(
+        200, content=b"x", headers={"content-type": "image/jpeg", "content-length": too_large}
+    )
+
+    with pytest.raises(HTTPException) as excinfo:
+        await sage_mcp.proxy_image(_Request(IMAGE_URL))
+    assert excinfo.value.status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_image_over_cache_cap_is_streamed_but_not_cached(sage_mcp, upstream, monkeypatch):
+    monkeypatch.setattr(sage_mcp, "_PROXY_CACHE_MAX_BYTES", 4)
+
+    for _ in range(2):
+        response = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+        assert await _read(response) == b"jpeg-bytes"
+        assert response.headers["x-sage-proxy"] == "true"
+    assert len(upstream.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_image_content_type_is_refused(sage_mcp, upstream):
+    upstream.handler = lambda request: httpx.Response(200, content=b"<html>", headers={"content-type": "text/html"})
+
+    with pytest.raises(HTTPException) as excinfo:
+        await sage_mcp.proxy_image(_Request(IMAGE_URL))
+    assert excinfo.value.status_code == 415
+
+
+@pytest.mark.asyncio
+async def test_octet_stream_image_gets_type_from_url(sage_mcp, upstream):
+    upstream.handler = lambda request: httpx.Response(
+        200, content=b"jpeg-bytes", headers={"content-type": "application/octet-stream"}
+    )
+
+    response = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+    assert await _read(response) == b"jpeg-bytes"
+    assert response.media_type == "image/jpeg"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_upstream_fetch(sage_mcp, upstream):
+    release = asyncio.Event()
+
+    async def slow_handler(request):
+        await release.wait()
+        return httpx.Response(200, content=b"jpeg-bytes", headers={"content-type": "image/jpeg"})
+
+    upstream.handler = slow_handler
+
+    async def fetch():
+        response = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+        return await _read(response), response.headers["x-sage-proxy"]
+
+    first = asyncio.ensure_future(fetch())
+    second = asyncio.ensure_future(fetch())
+    # Let both requests reach the upstream fetch / in-flight wait before answering
+    for _ in range(10):
+        await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(first, second)
+    assert sorted(results) == [(b"jpeg-bytes", "hit"), (b"jpeg-bytes", "true")]
+    assert len(upstream.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unlabelled_body_over_the_limit_is_cut_off(sage_mcp, upstream, monkeypatch):
+    monkeypatch.setattr(sage_mcp, "_PROXY_MAX_BYTES", 64)
+
+    async def body():
+        for _ in range(100):
+            yield b"x" * 16
+
+    # A streamed body carries no Content-Length, so only the running count can stop it
+    upstream.handler = lambda request: httpx.Response(200, content=body(), headers={"content-type": "image/jpeg"})
+
+    for _ in range(2):
+        response = await sage_mcp.proxy_image(_Request(IMAGE_URL))
+        # Nothing from the aborted fetch was cached
+        assert response.headers["x-sage-proxy"] == "true"
+        forwarded = 0
+        with pytest.raises(RuntimeError, match="exceeded 64 bytes"):
+            async for chunk in response.body_iterator:
+                forwarded += len(chunk)
+        assert forwarded <= 64
+    assert len(upstream.calls) == 2
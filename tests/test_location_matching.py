@@ -0,0 +1,64 @@
+import pytest
+
+MANIFEST = [
+    {"vsn": "W097", "name": "node-w097", "address": "Austin, TX", "location": ""},
+    {"vsn": "W001", "name": "node-w001", "address": "Chicago, IL", "location": "Chicago"},
+    {"vsn": "W027", "name": "node-w027", "address": "Portland, Oregon", "location": ""},
+    {"vsn": "W002", "name": "node-w002", "address": "Lemont, Illinois", "location": ""},
+    {"vsn": "W0B6", "name": "node-w0b6", "address": "", "location": "Miami, FL"},
+    {"vsn": "W0C1", "name": "node-w0c1", "address": None, "location": "Seattle, WA"},
+]
+
+
+def _vsns(nodes):
+    return [node["vsn"] for node in nodes]
+
+
+@pytest.fixture
+def match(sage_mcp):
+    manifest = [dict(node) for node in MANIFEST]
+    return lambda location: _vsns(sage_mcp._match_location(manifest, location))
+
+
+def test_city_names_match_address_or_location_substrings(match):
+    assert match("chicago") == ["W001"]
+    assert match("portland") == ["W027"]
+    assert match("miami") == ["W0B6"]
+    assert match("illinois") == ["W002"]
+    assert match("nowhere") == []
+
+
+def test_regions_resolve_to_nodes_in_their_states(match):
+    assert match("midwest") == ["W001", "W002"]
+    assert match("west coast") == ["W027", "W0C1"]
+    assert match("southwest") == ["W097"]
+    assert match("east coast") == ["W0B6"]
+
+
+def test_state_abbreviations_do_not_match_inside_longer_words(match):
+    # "in" appears in "austin" and "ca" in "chicago", but neither is a midwest/west coast state there
+    assert "W097" not in match("midwest")
+    assert "W001" not in match("west coast")
+
+
+def test_results_are_sorted_and_memoized_per_manifest(sage_mcp):
+    manifest = [dict(node) for node in MANIFEST]
+    first = sage_mcp._match_location(manifest, "midwest")
+    assert _vsns(first) == sorted(_vsns(first))
+    assert sage_mcp._match_location(manifest, "midwest") is first
+
+    # A new manifest object rebuilds the index
+    updated = manifest + [{"vsn": "W003", "name": "n", "address": "Ann Arbor, Michigan", "location": ""}]
+    assert _vsns(sage_mcp._match_location(updated, "midwest")) == ["W001", "W002", "W003"]
+
+
+def test_lookup_by_location_uses_the_manifest(sage_mcp, monkeypatch):
+    monkeypatch.setattr(sage_mcp, "_get_sage_json", lambda url: (200, [dict(node) for node in MANIFEST]))
+
+    nodes, error = sage_mcp._get_nodes_by_location_internal("  Midwest ")
+    assert error is None
+    assert _vsns(nodes) == ["W001", "W002"]
+
+    nodes, error = sage_mcp._get_nodes_by_location_internal("Atlantis")
+    assert nodes is None
+    assert error == "No Sage nodes found in Atlantis."
@@ -0,0 +1,160 @@
+import logging
+import threading
+
+import pandas as pd
+import pytest
+
+from sage_mcp_server import data_service, utils
+from sage_mcp_server.utils import parse_time_range
+
+ARGS = {"start": "2024-01-01T00:00:00Z", "end": "2024-01-01T01:00:00Z", "filter": {"name": "env.temperature"}}
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    data_service._QUERY_CACHE.clear()
+    yield
+    data_service._QUERY_CACHE.clear()
+    assert data_service._INFLIGHT_QUERIES == {}
+
+
+class _JoinWatcher(logging.Handler):
+    """Signals once a caller has joined an in-flight query"""
+
+    def __init__(self):
+        super().__init__()
+        self.joined = threading.Event()
+
+    def emit(self, record):
+        if "Joining identical in-flight" in record.getMessage():
+            self.joined.set()
+
+
+def _run_concurrently(monkeypatch, caplog, upstream):
+    """Call _coalesced_query from two threads while the first one's upstream request is held open"""
+    entered, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        entered.set()
+        assert release.wait(5)
+        return upstream()
+
+    monkeypatch.setattr(data_service.sage_data_client, "query", fake_query)
+    watcher = _JoinWatcher()
+    data_service.logger.addHandler(watcher)
+    caplog.set_level(logging.INFO, logger=data_service.logger.name)
+    results = [None, None]
+
+    def worker(i):
+        try:
+            results[i] = data_service._coalesced_query(dict(ARGS))
+        except Exception as e:
+            results[i] = e
+
+    try:
+        first = threading.Thread(target=worker, args=(0,))
+        first.start()
+        assert entered.wait(5)
+        second = threading.Thread(target=worker, args=(1,))
+        second.start()
+        assert watcher.joined.wait(5)
+        release.set()
+        first.join(5)
+        second.join(5)
+    finally:
+        release.set()
+        data_service.logger.removeHandler(watcher)
+    return calls, results
+
+
+def test_concurrent_identical_queries_share_one_upstream_call(monkeypatch, caplog):
+    frame = pd.DataFrame({"timestamp": pd.to_datetime(["2024-01-01T00:00:00Z"]), "value": [1.0]})
+    calls, results = _run_concurrently(monkeypatch, caplog, lambda: frame)
+
+    assert len(calls) == 1
+    for result in results:
+        pd.testing.assert_frame_equal(result, frame)
+    # Each caller gets its own frame object
+    assert results[0] is not results[1]
+
+
+def test_upstream_error_reaches_every_caller_and_is_not_cached(monkeypatch, caplog):
+    def fail():
+        raise RuntimeError("upstream 503")
+
+    calls, results = _run_concurrently(monkeypatch, caplog, fail)
+
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "upstream 503" for r in results)
+
+    # The failure was neither cached nor left in flight, so the next call goes upstream again
+    monkeypatch.setattr(data_service.sage_data_client, "query", lambda **kwargs: pd.DataFrame({"value": [2.0]}))
+    assert data_service._coalesced_query(dict(ARGS))["value"].tolist() == [2.0]
+
+
+def _query_relative(monkeypatch, now, time_range="-15m"):
+    monkeypatch.setattr(utils.time, "time", lambda: now)
+    start, end = parse_time_range(time_range)
+    return data_service.SageDataService.query_data(start, end, {"name": "env.temperature"})
+
+
+def test_relative_range_repeated_within_ttl_hits_the_cache(monkeypatch):
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame({"timestamp": pd.to_datetime(["2024-01-01T00:00:00Z"]), "value": [float(len(calls))]})
+
+    monkeypatch.setattr(data_service.sage_data_client, "query", fake_query)
+    aligned = 1704067200  # a multiple of the cache TTL
+
+    first = _query_relative(monkeypatch, aligned + 5)
+    again = _query_relative(monkeypatch, aligned + 20)
+    assert len(calls) == 1
+    assert first["value"].tolist() == again["value"].tolist() == [1.0]
+
+    # A different relative range, or the next TTL window, goes upstream again
+    _query_relative(monkeypatch, aligned + 20, "-1h")
+    _query_relative(monkeypatch, aligned + 35)
+    assert len(calls) == 3
+
+
+def test_distinct_historical_windows_never_share_an_entry(monkeypatch):
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame({"value": [float(len(calls))]})
+
+    monkeypatch.setattr(data_service.sage_data_client, "query", fake_query)
+    query = data_service.SageDataService.query_data
+
+    first = query("2024-01-01T00:00:10Z", "2024-01-01T01:00:10Z", {"name": "env.temperature"})
+    second = query("2024-01-01T00:00:25Z", "2024-01-01T01:00:25Z", {"name": "env.temperature"})
+    repeat = query("2024-01-01T00:00:10Z", "2024-01-01T01:00:10Z", {"name": "env.temperature"})
+
+    assert len(calls) == 2
+    assert first["value"].tolist() == repeat["value"].tolist() == [1.0]
+    assert second["value"].tolist() == [2.0]
+
+
+def test_frame_over_the_memory_budget_is_not_cached(monkeypatch):
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame({"value": [float(len(calls))] * 1000})
+
+    monkeypatch.setattr(data_service.sage_data_client, "query", fake_query)
+    frame_bytes = int(fake_query().memory_usage(deep=True).sum())
+    calls.clear()
+    monkeypatch.setattr(data_service._QUERY_CACHE, "maxweight", frame_bytes - 1)
+
+    first = data_service._coalesced_query(dict(ARGS))
+    second = data_service._coalesced_query(dict(ARGS))
+
+    assert len(calls) == 2
+    assert first["value"].iloc[0] == 1.0 and second["value"].iloc[0] == 2.0
+    assert data_service._QUERY_CACHE.weight == 0
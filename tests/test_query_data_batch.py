@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from conftest import tool_fn
+
+FILTER = {"name": "env.temperature", "vsn": "W001"}
+
+
+@pytest.fixture
+def queries(sage_mcp, monkeypatch):
+    """Replace the data service query with one that records max_records and honours it"""
+    seen = []
+    frame = pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=5, freq="s", tz="UTC"),
+        "name": "env.temperature",
+        "value": [20.0, 20.5, 21.0, 21.5, 22.0],
+    })
+
+    def fake_query(start, end=None, filter_params=None, user_token=None, max_records=1000, columns=None):
+        seen.append(max_records)
+        return frame.head(max_records)
+
+    monkeypatch.setattr(sage_mcp.SageDataService, "query_data", staticmethod(fake_query))
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_max_records_is_clamped(sage_mcp, queries):
+    batch = tool_fn(sage_mcp.query_data_batch)
+    results = await batch([
+        {"filter": FILTER, "max_records": 0},
+        {"filter": FILTER, "max_records": -5},
+        {"filter": FILTER, "max_records": 5000},
+        {"filter": FILTER},
+    ])
+
+    assert queries == [1, 1, 1000, 100]
+    assert [r["count"] for r in results] == [1, 1, 5, 5]
+    assert results[0]["records"][0]["value"] == 20.0
+
+
+@pytest.mark.asyncio
+async def test_bad_specs_get_their_own_error_entries(sage_mcp, queries):
+    batch = tool_fn(sage_mcp.query_data_batch)
+    results = await batch([
+        {"filter": FILTER, "max_records": 2},
+        {"filter": FILTER, "max_records": "lots"},
+        {"filter": FILTER, "max_records": None},
+        {"time_range": "-5m"},
+        {"filter": "env.temperature"},
+        "not a spec",
+    ])
+
+    assert results[0] == {"filter": FILTER, "count": 2, "records": results[0]["records"]}
+    for result in results[1:]:
+        assert set(result) == {"filter", "error"}
+    assert results[1]["filter"] == FILTER
+    assert "specific 'name' or 'plugin'" in results[3]["error"]
+    assert results[5] == {"filter": None, "error": "each spec must be an object"}
+    # Only the valid spec reached the data service
+    assert queries == [2]
+
+
+@pytest.mark.asyncio
+async def test_filters_must_select_a_measurement_or_plugin(sage_mcp, queries):
+    batch = tool_fn(sage_mcp.query_data_batch)
+    results = await batch([
+        {"filter": {"vsn": ".*"}},
+        {"filter": {"vsn": "W001"}},
+        {"filter": {"name": ".*", "vsn": "W001"}},
+        {"filter": {"plugin": "*"}},
+        {"filter": {"plugin": ".*cloud-cover.*"}},
+    ])
+
+    assert [("error" in r) for r in results] == [True, True, True, True, False]
+    assert len(queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_batches_are_rejected(sage_mcp, queries):
+    batch = tool_fn(sage_mcp.query_data_batch)
+    results = await batch([{"filter": FILTER}] * (sage_mcp._BATCH_MAX_SPECS + 1))
+
+    assert len(results) == 1
+    assert "Too many specs" in results[0]["error"]
+    assert queries == []
+
+
+@pytest.mark.asyncio
+async def test_upstream_queries_are_limited_in_concurrency(sage_mcp, monkeypatch):
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def slow_query(start, end=None, filter_params=None, user_token=None, max_records=1000, columns=None):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        return pd.DataFrame()
+
+    monkeypatch.setattr(sage_mcp.SageDataService, "query_data", staticmethod(slow_query))
+    batch = tool_fn(sage_mcp.query_data_batch)
+    results = await batch([{"filter": FILTER}] * sage_mcp._BATCH_MAX_SPECS)
+
+    assert [r["count"] for r in results] == [0] * sage_mcp._BATCH_MAX_SPECS
+    assert 1 < running["peak"] <= sage_mcp._BATCH_CONCURRENCY
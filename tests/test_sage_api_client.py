@@ -0,0 +1,60 @@
+import httpx
+import pytest
+
+URL = "https://auth.sagecontinuum.org/manifests/"
+
+
+@pytest.fixture
+def sage_api(sage_mcp, monkeypatch):
+    """Point the shared Sage client at a mock transport, keeping its redirect setting"""
+    class Upstream:
+        calls = []
+        responses = []
+
+    def handler(request):
+        Upstream.calls.append(str(request.url))
+        return Upstream.responses.pop(0)(request)
+
+    client = httpx.Client(
+        transport=httpx.MockTransport(handler),
+        follow_redirects=sage_mcp._SAGE_SESSION.follow_redirects,
+    )
+    monkeypatch.setattr(sage_mcp, "_SAGE_SESSION", client)
+    monkeypatch.setattr(sage_mcp.time, "sleep", lambda seconds: None)
+    sage_mcp._SAGE_API_CACHE.clear()
+    sage_mcp._SAGE_API_VALIDATORS.clear()
+    yield Upstream
+    sage_mcp._SAGE_API_CACHE.clear()
+    sage_mcp._SAGE_API_VALIDATORS.clear()
+
+
+def test_redirects_are_followed(sage_mcp, sage_api):
+    sage_api.responses = [
+        lambda request: httpx.Response(301, headers={"Location": "https://auth.sagecontinuum.org/manifests"}),
+        lambda request: httpx.Response(200, json=[{"vsn": "W001"}]),
+    ]
+
+    assert sage_mcp._get_sage_json(URL) == (200, [{"vsn": "W001"}])
+    assert len(sage_api.calls) == 2
+
+
+def test_gateway_errors_are_retried(sage_mcp, sage_api):
+    sage_api.responses = [
+        lambda request: httpx.Response(503),
+        lambda request: httpx.Response(502),
+        lambda request: httpx.Response(200, json={"ok": True}),
+    ]
+
+    assert sage_mcp._get_sage_json(URL) == (200, {"ok": True})
+    assert len(sage_api.calls) == 3
+
+
+def test_retries_give_up_and_other_errors_are_not_retried(sage_mcp, sage_api):
+    sage_api.responses = [lambda request: httpx.Response(504)] * (sage_mcp._SAGE_STATUS_RETRIES + 1)
+    assert sage_mcp._get_sage_json(URL) == (504, None)
+    assert len(sage_api.calls) == sage_mcp._SAGE_STATUS_RETRIES + 1
+
+    sage_api.calls.clear()
+    sage_api.responses = [lambda request: httpx.Response(404)]
+    assert sage_mcp._get_sage_json(URL) == (404, None)
+    assert len(sage_api.calls) == 1
@@ -0,0 +1,114 @@
+from sage_mcp_server import utils
+from sage_mcp_server.utils import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    cache = TTLCache(maxsize=4, ttl=10)
+
+    cache.set("a", 1)
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+
+
+def test_least_recently_used_entry_is_evicted_at_maxsize():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_overwriting_a_key_replaces_value_and_refreshes_expiry(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    cache = TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock.now += 8
+    cache.set("a", 10)
+    clock.now += 8
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+    # Overwriting doesn't add an entry, so nothing else was evicted
+    cache.set("c", 3)
+    assert cache.get("a") == 10
+
+
+def test_clear_removes_everything():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_weight_budget_evicts_least_recently_used_entries():
+    cache = TTLCache(maxsize=10, ttl=60, maxweight=10, weigh=len)
+
+    cache.set("a", b"xxxx")
+    cache.set("b", b"xxxx")
+    assert cache.get("a") == b"xxxx"  # "b" is now the least recently used
+    cache.set("c", b"xxxx")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"xxxx"
+    assert cache.get("c") == b"xxxx"
+    assert cache.weight == 8
+
+
+def test_weight_is_tracked_through_overwrite_expiry_and_clear(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    cache = TTLCache(maxsize=10, ttl=10, maxweight=10, weigh=len)
+
+    cache.set("a", b"xxxxxx")
+    cache.set("a", b"xx")
+    assert cache.weight == 2
+    # A value over the whole budget is not stored, and doesn't leave the old value behind
+    cache.set("a", b"x" * 11)
+    assert cache.get("a") is None
+    assert cache.weight == 0
+
+    cache.set("b", b"xxx")
+    clock.now += 10
+    assert cache.get("b") is None
+    assert cache.weight == 0
+
+    cache.set("c", b"xxx")
+    cache.clear()
+    assert cache.weight == 0
+
+
+def test_set_purges_expired_entries_that_are_never_read_again(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    cache = TTLCache(maxsize=10, ttl=10, maxweight=100, weigh=len)
+
+    cache.set("a", b"xxxx")
+    cache.set("b", b"xxxx")
+    clock.now += 5
+    assert cache.get("a") == b"xxxx"  # reads reorder by recency, not expiry
+    clock.now += 5
+    cache.set("c", b"xx")
+
+    assert cache.weight == 2
+    assert list(cache._data) == ["c"]
@@ -0,0 +1,79 @@
+import pytest
+import pandas as pd
+
+from conftest import tool_fn
+
+
+def _frame(values):
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=len(values), freq="s", tz="UTC"),
+        "name": "sys.mem.used",
+        "value": values,
+        "meta.vsn": "W001",
+        "meta.sensor": "host",
+        "plugin": "waggle/plugin-sys:0.1",
+    })
+
+
+def test_node_data_keeps_full_precision_for_large_values(sage_mcp, monkeypatch):
+    values = [8123456805.0, 8123457300.0, 8123457783.0]
+    monkeypatch.setattr(sage_mcp.data_service, "query_node_data", lambda *a, **k: _frame(values))
+
+    out = tool_fn(sage_mcp.get_node_all_data)("W001", "-5m")
+
+    assert "Range: 8123456805.00 to 8123457783.00" in out
+    assert f"Average: {sum(values) / len(values):.2f}" in out
+
+
+def _stats_input():
+    df = pd.DataFrame({
+        "name": ["env.temperature", "env.temperature", "env.temperature", "env.pressure", "env.pressure", None],
+        "meta.sensor": ["bme680", "bme680", "bme680", "bme280", "bme280", "bme680"],
+        "value": [20.0, float("nan"), 22.0, 1000.5, 8123457783.0, 5.0],
+    })
+    df["name"] = df["name"].astype("category")
+    return df
+
+
+EXPECTED_STATS = pd.DataFrame(
+    {
+        "count": [2, 2],
+        "min": [1000.5, 20.0],
+        "max": [8123457783.0, 22.0],
+        "mean": [(1000.5 + 8123457783.0) / 2, 21.0],
+    },
+    index=pd.MultiIndex.from_tuples(
+        [("env.pressure", "bme280"), ("env.temperature", "bme680")], names=["name", "meta.sensor"]
+    ),
+)
+
+
+def _normalized(stats):
+    stats = stats.reset_index()
+    stats["name"] = stats["name"].astype(str)
+    return stats.set_index(["name", "meta.sensor"])
+
+
+def test_value_stats_pandas_skips_nan_values_and_keys(sage_mcp, monkeypatch):
+    monkeypatch.setattr(sage_mcp, "_USE_POLARS", False)
+
+    stats = sage_mcp._value_stats(_stats_input(), ["name", "meta.sensor"])
+
+    pd.testing.assert_frame_equal(_normalized(stats), EXPECTED_STATS, check_dtype=False)
+
+
+def test_value_stats_polars_matches_pandas(sage_mcp, monkeypatch):
+    polars = pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(sage_mcp, "pl", polars, raising=False)
+    df = _stats_input()
+
+    monkeypatch.setattr(sage_mcp, "_USE_POLARS", False)
+    expected = sage_mcp._value_stats(df, ["name", "meta.sensor"])
+    monkeypatch.setattr(sage_mcp, "_USE_POLARS", True)
+    actual = sage_mcp._value_stats(df, ["name", "meta.sensor"])
+
+    pd.testing.assert_frame_equal(_normalized(actual), _normalized(expected), check_dtype=False)
+    # Values that arrive as objects are converted to numbers first
+    actual_object = sage_mcp._value_stats(df.astype({"value": object}), ["name", "meta.sensor"])
+    pd.testing.assert_frame_equal(_normalized(actual_object), _normalized(expected), check_dtype=False)